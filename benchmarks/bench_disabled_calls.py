@@ -0,0 +1,29 @@
+"""Cost of a call to a disabled level method, before and after set_level() rebinding.
+
+    python benchmarks/bench_disabled_calls.py
+"""
+import timeit
+
+from logmagix import Logger, LogLevel
+
+NUMBER = 1_000_000
+
+def main():
+    for style in (1, 2):
+        log = Logger(style=style, level=LogLevel.INFO)
+        cls = type(log)
+        payload = {"user": "x" * 64, "items": list(range(32))}
+
+        cases = {
+            # Going through the method body and _should_log, as every call did before rebinding
+            "method body": lambda: cls.debug(log, "payload=%s", payload),
+            "rebound no-op": lambda: log.debug("payload=%s", payload),
+            "is_enabled guard": lambda: log.is_enabled(LogLevel.DEBUG) and log.debug("payload=%s", payload),
+        }
+        print(f"{cls.__name__} (level=INFO, debug disabled)")
+        for name, call in cases.items():
+            best = min(timeit.repeat(call, number=NUMBER, repeat=5))
+            print(f"  {name:<18} {best / NUMBER * 1e9:8.1f} ns/call")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Import-time regression check for `import logmagix`, based on `python -X importtime`.
+
+    python benchmarks/bench_import.py [--budget-ms 50] [--runs 5]
+
+Exits with status 1 when the import is slower than the budget or when it pulls in
+modules that should only load on first use (network stack, pystyle, fonts, updater).
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Modules that must not be imported by a bare `import logmagix`
+LAZY_MODULES = ("requests", "urllib3", "socket", "pystyle", "packaging", "multiprocessing", "logmagix.font", "logmagix.updater")
+
+CHECK = (
+    "import sys, threading, logmagix, logmagix.logger; "
+    "print(','.join(m for m in %r if m in sys.modules)); "
+    "print(logmagix.logger._default_log is None, threading.active_count())"
+) % (LAZY_MODULES,)
+
+def import_times() -> dict:
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": ""}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import logmagix"],
+                            capture_output=True, text=True, env=env, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not cumulative_us.strip().isdigit():
+            continue
+        name = name.strip()
+        if name == "site":
+            # Everything before this line was imported by interpreter startup
+            times.clear()
+            continue
+        times[name] = (int(self_us), int(cumulative_us))
+    return times
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # Warm-up run writes the bytecode cache so compilation is not measured
+    import_times()
+    runs = [import_times() for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times["logmagix"][1])
+    total_ms = best["logmagix"][1] / 1000
+
+    print(f"import logmagix: {total_ms:.1f} ms (best of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    print("Slowest modules (cumulative):")
+    for name, (self_us, cumulative_us) in sorted(best.items(), key=lambda item: -item[1][1])[:10]:
+        print(f"  {cumulative_us / 1000:7.2f} ms  {name}")
+
+    result = subprocess.run([sys.executable, "-c", CHECK], capture_output=True, text=True, check=True)
+    loaded, state = result.stdout.splitlines()
+    default_log_unset, threads = state.split()
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import took {total_ms:.1f} ms")
+    if loaded:
+        failures.append(f"eagerly imported: {loaded}")
+    if default_log_unset != "True":
+        failures.append("default logger was created at import time")
+    if threads != "1":
+        failures.append(f"{int(threads) - 1} thread(s) started at import time")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Throughput and per-call latency of ColorLogger and SimpleLogger, compared with stdlib logging.
+
+    python benchmarks/bench_suite.py [--lines 50000] [--threads 4] [--output results.json]
+
+Console output goes to /dev/null and log files to a tmpfs directory (/dev/shm when available), so the
+numbers measure the loggers rather than the terminal or disk. The Loader cases write to a /dev/null stream that
+reports itself as a terminal, since loaders only draw frames on a tty. Results are saved as JSON so runs can be
+diffed between releases.
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from time import perf_counter_ns
+
+from logmagix import Loader, Logger, LogLevel, __version__
+
+MESSAGE = "Processed item %d of batch %s"
+
+class NullTerminal(io.TextIOWrapper):
+    # /dev/null that passes for a terminal, so the renderer draws loader frames into it
+    def __init__(self):
+        super().__init__(open(os.devnull, "wb"), encoding="utf-8", line_buffering=True)
+
+    def isatty(self) -> bool:
+        return True
+
+@contextlib.contextmanager
+def console(stream):
+    stdout, sys.stdout = sys.stdout, stream
+    try:
+        yield
+    finally:
+        sys.stdout = stdout
+
+def scratch_dir() -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return tempfile.mkdtemp(prefix="logmagix-bench-", dir=base)
+
+def percentiles(samples: list) -> dict:
+    samples.sort()
+    pick = lambda q: samples[min(len(samples) - 1, int(q / 100 * len(samples)))]
+    return {"p50_ns": pick(50), "p95_ns": pick(95), "p99_ns": pick(99), "max_ns": samples[-1]}
+
+def measure(call, lines: int) -> dict:
+    # Throughput without per-call timing, then a second pass timing every call for the latency percentiles
+    started = perf_counter_ns()
+    for i in range(lines):
+        call(i)
+    elapsed = perf_counter_ns() - started
+
+    samples = []
+    for i in range(lines):
+        t0 = perf_counter_ns()
+        call(i)
+        samples.append(perf_counter_ns() - t0)
+    return {"lines_per_sec": round(lines / (elapsed / 1e9)), **percentiles(samples)}
+
+def measure_threaded(call, lines: int, threads: int) -> dict:
+    per_thread = lines // threads
+    samples = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(out: list) -> None:
+        barrier.wait()
+        for i in range(per_thread):
+            t0 = perf_counter_ns()
+            call(i)
+            out.append(perf_counter_ns() - t0)
+
+    workers = [threading.Thread(target=worker, args=(out,)) for out in samples]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = perf_counter_ns()
+    for thread in workers:
+        thread.join()
+    elapsed = perf_counter_ns() - started
+    return {"lines_per_sec": round(per_thread * threads / (elapsed / 1e9)), **percentiles([s for out in samples for s in out])}
+
+def logmagix_logger(style: int, directory: str, log_file: bool = False, level: LogLevel = LogLevel.DEBUG) -> Logger:
+    path = os.path.join(directory, f"logmagix-{style}-{time.monotonic_ns()}.log") if log_file else None
+    return Logger(style=style, prefix="bench", level=level, log_file=path, check_updates=False)
+
+def stdlib_logger(directory: str, devnull, log_file: bool = False, level: int = logging.DEBUG) -> logging.Logger:
+    logger = logging.getLogger(f"bench-{time.monotonic_ns()}")
+    logger.propagate = False
+    logger.setLevel(level)
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] -> %(message)s", "%H:%M:%S")
+    handlers = [logging.StreamHandler(devnull)]
+    if log_file:
+        handlers.append(logging.FileHandler(os.path.join(directory, f"stdlib-{time.monotonic_ns()}.log"), encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    return logger
+
+def close_stdlib(logger: logging.Logger) -> None:
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+
+def run(lines: int, threads: int, devnull, terminal, directory: str) -> dict:
+    results = {}
+
+    for name, style in (("ColorLogger", 1), ("SimpleLogger", 2)):
+        cases = results.setdefault(name, {})
+
+        log = logmagix_logger(style, directory)
+        cases["stdout"] = measure(lambda i: log.info(MESSAGE, i, "A"), lines)
+
+        log = logmagix_logger(style, directory, log_file=True)
+        cases["stdout+file"] = measure(lambda i: log.info(MESSAGE, i, "A"), lines)
+        log.close()
+
+        log = logmagix_logger(style, directory, level=LogLevel.WARNING)
+        cases["disabled"] = measure(lambda i: log.debug(MESSAGE, i, "A"), lines)
+
+        log = logmagix_logger(style, directory, log_file=True)
+        cases["threads"] = measure_threaded(lambda i: log.info(MESSAGE, i, "A"), lines, threads)
+        log.close()
+
+        log = logmagix_logger(style, directory)
+        with console(terminal), Loader(prefix="bench", desc="Benchmarking", timeout=0.05):
+            cases["stdout+loader"] = measure(lambda i: log.info(MESSAGE, i, "A"), lines)
+
+    cases = results.setdefault("stdlib logging", {})
+    logger = stdlib_logger(directory, devnull)
+    cases["stdout"] = measure(lambda i: logger.info(MESSAGE, i, "A"), lines)
+    close_stdlib(logger)
+
+    logger = stdlib_logger(directory, devnull, log_file=True)
+    cases["stdout+file"] = measure(lambda i: logger.info(MESSAGE, i, "A"), lines)
+    close_stdlib(logger)
+
+    logger = stdlib_logger(directory, devnull, level=logging.WARNING)
+    cases["disabled"] = measure(lambda i: logger.debug(MESSAGE, i, "A"), lines)
+    close_stdlib(logger)
+
+    logger = stdlib_logger(directory, devnull, log_file=True)
+    cases["threads"] = measure_threaded(lambda i: logger.info(MESSAGE, i, "A"), lines, threads)
+    close_stdlib(logger)
+
+    # stdlib has no loader; its plain stdout numbers are the reference for the Loader case
+    cases["stdout+loader"] = cases["stdout"]
+
+    starts = []
+    with console(terminal):
+        for _ in range(200):
+            t0 = perf_counter_ns()
+            Loader(prefix="bench", desc="Start/stop", timeout=0.05).start().stop()
+            starts.append(perf_counter_ns() - t0)
+    results["Loader start/stop"] = percentiles(starts)
+    return results
+
+def print_table(results: dict) -> None:
+    loggers = [name for name in results if name != "Loader start/stop"]
+    print(f"{'case':<15}" + "".join(f"{name:>28}" for name in loggers))
+    for case in results["stdlib logging"]:
+        row = f"{case:<15}"
+        for name in loggers:
+            data = results[name][case]
+            row += f"{data['lines_per_sec']:>12,} l/s p99 {data['p99_ns'] / 1000:>7.1f}us"
+        print(row)
+    data = results["Loader start/stop"]
+    print(f"Loader start/stop: p50 {data['p50_ns'] / 1000:.1f}us, p99 {data['p99_ns'] / 1000:.1f}us")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=50_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--output", default=f"bench-{__version__}.json")
+    args = parser.parse_args()
+
+    directory = scratch_dir()
+    stdout = sys.stdout
+    try:
+        with open(os.devnull, "w") as devnull, NullTerminal() as terminal:
+            # print() resolves sys.stdout per call, so the loggers' console output goes to /dev/null
+            sys.stdout = devnull
+            try:
+                results = run(args.lines, args.threads, devnull, terminal, directory)
+            finally:
+                sys.stdout = stdout
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    report = {
+        "logmagix": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "lines": args.lines,
+        "threads": args.threads,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_table(results)
+    print(f"Saved {args.output}")
+
+if __name__ == "__main__":
+    main()
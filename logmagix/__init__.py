@@ -1,6 +1,22 @@
 # logmagix/__init__.py
 
-from .logger import Logger, Loader, Home, LogLevel
-from .updater import AutoUpdater
+from .logger import Logger, Loader, AsyncLoader, Progress, Home, LogLevel
+from .sinks import ConsoleSink, FileSink, JsonSink, RotatingFileSink
+from .filters import RateSampler, EveryNSampler, FirstNSampler
+from .multiprocess import LogListener, worker_init, worker_logger
+from .version import __version__
 
-__all__ = ["Logger", "Loader", "Home", "AutoUpdater", "__version__"]
+__all__ = ["Logger", "Loader", "AsyncLoader", "Progress", "Home", "LogLevel", "ConsoleSink", "FileSink", "JsonSink", "RotatingFileSink", "RateSampler", "EveryNSampler", "FirstNSampler", "LogListener", "worker_init", "worker_logger", "AutoUpdater", "LogMagixHandler", "LogMagixFormatter", "RingBufferSink", "read_ring", "__version__"]
+
+def __getattr__(name):
+    # The updater pulls in packaging (and requests when it checks), so it is only imported when asked for
+    if name == "AutoUpdater":
+        from .updater import AutoUpdater
+        return AutoUpdater
+    if name in ("LogMagixHandler", "LogMagixFormatter"):
+        from . import stdlib
+        return getattr(stdlib, name)
+    if name in ("RingBufferSink", "read_ring"):
+        from . import ring
+        return getattr(ring, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
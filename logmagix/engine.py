@@ -0,0 +1,104 @@
+import queue
+import time
+from threading import Thread
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+_STOP = object()
+
+class LogRecord:
+    __slots__ = ("kind", "label", "message", "start", "end", "created", "level", "fields", "sample_rate", "context")
+
+    def __init__(self, kind: str, label: str | None, message: str, start: float = None, end: float = None, level=None, fields: dict | None = None):
+        self.kind = kind
+        self.label = label
+        self.message = message
+        self.start = start
+        self.end = end
+        self.created = time.time()
+        self.level = level
+        self.fields = fields
+        self.sample_rate = None
+        self.context = None
+
+class AsyncEngine:
+    def __init__(self, handler, maxsize: int = 10000, overflow: str = "block"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}, expected one of {', '.join(OVERFLOW_POLICIES)}")
+
+        self.overflow = overflow
+        self.dropped = 0
+        self.high_water = 0
+        self._handler = handler
+        self._queue = queue.Queue(maxsize)
+        self._closed = False
+        self._thread = Thread(target=self._run, name="logmagix-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, record: LogRecord) -> None:
+        if self._closed:
+            # A caller that still held the engine when it was closed: nothing reads the queue any more
+            self._handler(record)
+            return
+        # len() of the underlying deque is read without the queue's lock; close enough for a high-water mark
+        depth = len(self._queue.queue)
+        if depth > self.high_water:
+            self.high_water = depth
+        if self.overflow == "block":
+            self._queue.put(record)
+            return
+
+        while True:
+            try:
+                self._queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.overflow == "drop_newest":
+                    self.dropped += 1
+                    return
+            # drop_oldest: make room by discarding the head of the queue
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            record = get()
+            try:
+                if record is _STOP:
+                    return
+                self._handler(record)
+            except Exception as e:
+                print(f"Error in log writer: {e}")
+            finally:
+                self._queue.task_done()
+
+    def full(self) -> bool:
+        return 0 < self._queue.maxsize <= len(self._queue.queue)
+
+    def wait_for_room(self) -> None:
+        # Blocks until put() would not block; run in an executor by the awaitable log methods
+        q = self._queue
+        with q.not_full:
+            while 0 < q.maxsize <= q._qsize():
+                q.not_full.wait()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> None:
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
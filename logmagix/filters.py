@@ -0,0 +1,162 @@
+import random
+import time
+from collections import OrderedDict
+from itertools import count
+from threading import Lock
+
+from .sinks import _flusher
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "_tokens", "_updated")
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def allow(self, now: float) -> bool:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+class Suppressor:
+    # Collapses repeats of a message (or of a caller-supplied key) within `window` seconds and
+    # applies per-level token buckets. Suppressed lines are reported later as one summary line.
+    def __init__(self, emit, window: float | None = None, max_keys: int = 1024, rate_limits: dict | None = None,
+                 summary_interval: float = 1.0):
+        self._emit = emit
+        self.window = window
+        self.max_keys = max_keys
+        self.summary_interval = summary_interval
+        self.suppressed = 0
+        # key -> [window start, repeats, level, kind, label, message]; insertion order doubles as LRU order
+        self._recent = OrderedDict()
+        self._buckets = {level: TokenBucket(*spec) if isinstance(spec, tuple) else TokenBucket(spec) for level, spec in (rate_limits or {}).items()}
+        # level -> [suppressed count, kind, label]
+        self._limited = {}
+        self._lock = Lock()
+        self._last_summary = time.monotonic()
+        _flusher.register(self)
+
+    def admit(self, level, kind: str, label: str | None, message: str, key=None) -> bool:
+        now = time.monotonic()
+        summaries = []
+        with self._lock:
+            if self.window:
+                key = (kind, message) if key is None else key
+                entry = self._recent.get(key)
+                if entry is not None and now - entry[0] < self.window:
+                    entry[1] += 1
+                    self._recent.move_to_end(key)
+                    self.suppressed += 1
+                    return False
+                if entry is not None:
+                    del self._recent[key]
+                    if entry[1]:
+                        summaries.append(entry)
+
+            bucket = self._buckets.get(level)
+            allowed = bucket is None or bucket.allow(now)
+            if not allowed:
+                limited = self._limited.setdefault(level, [0, kind, label])
+                limited[0] += 1
+                self.suppressed += 1
+            elif self.window:
+                # Only a line that is actually shown starts a window; later repeats of a rate-limited line
+                # are checked against the bucket again instead of being reported as repeats of it
+                self._recent[key] = [now, 0, level, kind, label, message]
+                if len(self._recent) > self.max_keys:
+                    evicted = self._recent.popitem(last=False)[1]
+                    if evicted[1]:
+                        summaries.append(evicted)
+
+        for entry in summaries:
+            self._emit_repeated(entry)
+        return allowed
+
+    def _emit_repeated(self, entry: list) -> None:
+        started, repeats, level, kind, label, message = entry
+        self._emit(level, kind, label, f"{message} (repeated {repeats} times)")
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        if now - self._last_summary < self.summary_interval:
+            return
+        self.flush(now)
+
+    def flush(self, now: float | None = None) -> None:
+        now = now or time.monotonic()
+        summaries, limited = [], []
+        with self._lock:
+            self._last_summary = now
+            if self.window:
+                expired = [key for key, entry in self._recent.items() if now - entry[0] >= self.window]
+                for key in expired:
+                    entry = self._recent.pop(key)
+                    if entry[1]:
+                        summaries.append(entry)
+            for level, (count, kind, label) in self._limited.items():
+                limited.append((level, kind, label, count))
+            self._limited.clear()
+
+        for entry in summaries:
+            self._emit_repeated(entry)
+        for level, kind, label, count in limited:
+            self._emit(level, kind, label, f"Rate limit: suppressed {count} {level.name} messages")
+
+    def close(self) -> None:
+        self.flush(float("inf"))
+        _flusher.unregister(self)
+
+class RateSampler:
+    # Keeps each line with probability `rate`
+    needs_site = False
+
+    def __init__(self, rate: float):
+        if not 0 < rate <= 1:
+            raise ValueError(f"Sample rate must be in (0, 1], got {rate}")
+        self.rate = rate
+
+    def sample(self, site=None) -> float | None:
+        return self.rate if random.random() < self.rate else None
+
+class EveryNSampler:
+    # Keeps the 1st, (n+1)th, (2n+1)th... call of each call site
+    needs_site = True
+
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}")
+        self.n = n
+        self.rate = 1 / n
+        self._counters = {}
+
+    def sample(self, site=None) -> float | None:
+        counter = self._counters.get(site)
+        if counter is None:
+            counter = self._counters.setdefault(site, count())
+        return self.rate if next(counter) % self.n == 0 else None
+
+class FirstNSampler:
+    # Keeps the first n calls of each call site, then samples the rest at `then`
+    needs_site = True
+
+    def __init__(self, n: int, then: float = 0.01):
+        self.n = n
+        self.then = RateSampler(then)
+        self._counters = {}
+
+    def sample(self, site=None) -> float | None:
+        counter = self._counters.get(site)
+        if counter is None:
+            counter = self._counters.setdefault(site, count())
+        if next(counter) < self.n:
+            return 1.0
+        return self.then.sample()
+
+def make_sampler(spec):
+    return RateSampler(spec) if isinstance(spec, (int, float)) else spec
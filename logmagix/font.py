@@ -1,605 +1,77 @@
-ascii_art = {
-    'A': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$$$$$$$ ',
-        r'| $$__  $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'|__/  |__/'
-    ],
-    'B': [
-        r' /$$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$$$$$$/ ',
-        r'|_______/  '
-    ],
-    'C': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \__/ ',
-        r'| $$       ',
-        r'| $$       ',
-        r'| $$    $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'D': [
-        r' /$$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$$$$$$/ ',
-        r'|_______/  '
-    ],
-    'E': [
-        r' /$$$$$$$$ ',
-        r'| $$_____/ ',
-        r'| $$       ',
-        r'| $$$$$    ',
-        r'| $$__/    ',
-        r'| $$       ',
-        r'| $$$$$$$$ ',
-        r'|________/ '
-    ],
-    'F': [
-        r' /$$$$$$$$ ',
-        r'| $$_____/ ',
-        r'| $$       ',
-        r'| $$$$$    ',
-        r'| $$__/    ',
-        r'| $$       ',
-        r'| $$       ',
-        r'|__/       '
-    ],
-    'G': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \__/ ',
-        r'| $$ /$$$$ ',
-        r'| $$|_  $$ ',
-        r'| $$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'H': [
-        r' /$$   /$$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$$$$$$$ ',
-        r'| $$__  $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'|__/  |__/ '
-    ],
-    'I': [
-        r' /$$$$$$ ',
-        r'|_  $$_/ ',
-        r'  | $$   ',
-        r'  | $$   ',
-        r'  | $$   ',
-        r'  | $$   ',
-        r' /$$$$$$ ',
-        r'|______/ '
-    ],
-    'J': [
-        r'    /$$$$$ ',
-        r'   |__  $$ ',
-        r'      | $$ ',
-        r'      | $$ ',
-        r' /$$  | $$ ',
-        r'| $$  | $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'K': [
-        r' /$$   /$$ ',
-        r'| $$  /$$/ ',
-        r'| $$ /$$/  ',
-        r'| $$$$$/   ',
-        r'| $$  $$   ',
-        r'| $$\  $$  ',
-        r'| $$ \  $$ ',
-        r'|__/  \__/ '
-    ],
-    'L': [
-        r' /$$       ',
-        r'| $$       ',
-        r'| $$       ',
-        r'| $$       ',
-        r'| $$       ',
-        r'| $$       ',
-        r'| $$$$$$$$ ',
-        r'|________/ '
-    ],
-    'M': [
-        r' /$$      /$$ ',
-        r'| $$$    /$$$ ',
-        r'| $$$$  /$$$$ ',
-        r'| $$ $$/$$ $$ ',
-        r'| $$  $$$| $$ ',
-        r'| $$\  $ | $$ ',
-        r'| $$ \/  | $$ ',
-        r'|__/     |__/ '
-    ],
-    'N': [
-        r' /$$   /$$ ',
-        r'| $$$ | $$ ',
-        r'| $$$$| $$ ',
-        r'| $$ $$ $$ ',
-        r'| $$  $$$$ ',
-        r'| $$\  $$$ ',
-        r'| $$ \  $$ ',
-        r'|__/  \__/ '
-    ],
-    'O': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'P': [
-        r' /$$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$$$$$$/ ',
-        r'| $$____/  ',
-        r'| $$       ',
-        r'| $$       ',
-        r'|__/       '
-    ],
-    'Q': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$  | $$ ',
-        r'| $$/$$ $$ ',
-        r'|  $$$$$$/ ',
-        r' \____ $$$ ',
-        r'      \__/ ',
-    ],
-    'R': [
-        r' /$$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$$$$$$/ ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$  | $$ ',
-        r'|__/  |__/ '
-    ],
-    'S': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \__/ ',
-        r'|  $$$$$$  ',
-        r' \____  $$ ',
-        r' /$$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'T': [
-        r' /$$$$$$$$ ',
-        r'|__  $$__/ ',
-        r'   | $$    ',
-        r'   | $$    ',
-        r'   | $$    ',
-        r'   | $$    ',
-        r'   | $$    ',
-        r'   |__/    '
-    ],
-    'U': [
-        r' /$$   /$$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'V': [
-        r' /$$    /$$ ',
-        r'| $$   | $$ ',
-        r'| $$   | $$ ',
-        r'|  $$ / $$/ ',
-        r' \  $$ $$/  ',
-        r'  \  $$$/   ',
-        r'   \  $/    ',
-        r'    \_/     '
-    ],
-    'W': [
-        r' /$$      /$$ ',
-        r'| $$  /$ | $$ ',
-        r'| $$ /$$$| $$ ',
-        r'| $$/$$ $$ $$ ',
-        r'| $$$$_  $$$$ ',
-        r'| $$$/ \  $$$ ',
-        r'| $$/   \  $$ ',
-        r'|__/     \__/ ',
-    ],
-    'X': [
-        r' /$$   /$$ ',
-        r'| $$  / $$ ',
-        r'|  $$/ $$/ ',
-        r' \  $$$$/  ',
-        r'  >$$  $$  ',
-        r' /$$/\  $$ ',
-        r'| $$  \ $$ ',
-        r'|__/  \__/ ',
-    ],
-    'Y': [
-        r' /$$     /$$ ',
-        r'|  $$   /$$/ ',
-        r' \  $$ /$$/  ',
-        r'  \  $$$$/   ',
-        r'   \  $$/    ',
-        r'    | $$     ',
-        r'    | $$     ',
-        r'    |__/     ',
-    ],
-    'Z': [
-        r' /$$$$$$$$ ',
-        r'|_____ $$  ',
-        r'     /$$/  ',
-        r'    /$$/   ',
-        r'   /$$/    ',
-        r'  /$$/     ',
-        r' /$$$$$$$$ ',
-        r'|________/ ',
-    ],
-    'a': [
-        r'  /$$$$$$  ',
-        r' |____  $$ ',
-        r'  /$$$$$$$ ',
-        r' /$$__  $$ ',
-        r'|  $$$$$$$ ',
-        r' \_______/ ',
-    ],
-    'b': [
-        r' /$$       ',
-        r'| $$       ',
-        r'| $$$$$$$  ',
-        r'| $$    $$ ',
-        r'| $$$$$$$/ ',
-        r'|_______/  '
-    ],
-    'c': [
-        r'  /$$$$$$$ ',
-        r' /$$_____/ ',
-        r'| $$       ',
-        r'| $$       ',
-        r'|  $$$$$$$ ',
-        r' \_______/ '
-    ],
-    'd': [
-        r'       /$$ ',
-        r'      | $$ ',
-        r'  /$$$$$$$ ',
-        r' /$$    $$ ',
-        r'|  $$$$$$$ ',
-        r' \_______/ '
-    ],
-    'e': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$$$$$$$ ',
-        r'| $$_____/ ',
-        r'|  $$$$$$$ ',
-        r' \_______/ '
-    ],
-    'f': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \__/ ',
-        r'| $$$$     ',
-        r'| $$|      ',
-        r'|___|      '
-    ],
-    'g': [
-        r'  /$$$$$$  ',
-        r' /$$    $$ ',
-        r'|  $$$$$$$ ',
-        r' \____  $$ ',
-        r' /$$  \ $$ ',
-        r'|  $$$$$$/ ',
-    ],
-    'h': [
-        r' /$$       ',
-        r'| $$       ',
-        r'| $$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'|__/  |__/ '
-    ],
-    'i': [
-        r' /$$ ',
-        r'|__/ ',
-        r' /$$ ',
-        r'| $$ ',
-        r'| $$ ',
-        r'|__/ '
-    ],
-    'j': [
- 
-        r'       /$$ ',
-        r'      |__/ ',
-        r'       /$$ ',
-        r' /$$  | $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'k': [
-        r' /$$   /$$ ',
-        r'| $$  /$$/ ',
-        r'| $$$$$$/  ',
-        r'| $$_  $$  ',
-        r'| $$ \  $$ ',
-        r'|__/  \__/ '
-    ],
-    'l': [
-        r' /$$ ',
-        r'| $$ ',
-        r'| $$ ',
-        r'| $$ ',
-        r'| $$ ',
-        r'|__/ '
-    ],
-    'm': [
-        r' /$$$$$$/$$$$  ',
-        r'| $$_  $$_  $$ ',
-        r'| $$ \ $$ \ $$ ',
-        r'| $$ | $$ | $$ ',
-        r'| $$ | $$ | $$ ',
-        r'|__/ |__/ |__/ '
-    ],
-    'n': [
-        r' /$$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'|__/  |__/ '
-    ],
-    'o': [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \ $$ ',
-        r'| $$  | $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  '
-    ],
-    'p': [
-        r'  /$$$$$$  ',
-        r' /$$    $$ ',
-        r'| $$$$$$$/ ',
-        r'| $$____/  ',
-        r'| $$       ',
-        r'|__/       '
-    ],
-    'q': [
-
-        r'  /$$$$$$  ',
-        r' /$$    $$ ',
-        r'|  $$$$$$$ ',
-        r' \____  $$ ',
-        r'      | $$ ',
-        r'      |__/ '
-    ],
-    'r': [
-
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \__/ ',
-        r'| $$       ',
-        r'| $$       ',
-        r'|__/       ',
-    ],
-    's': [
-        r'  /$$$$$$$ ',
-        r' /$$_____/ ',
-        r'|  $$$$$$  ',
-        r' \____  $$ ',
-        r' /$$$$$$$/ ',
-        r'|_______/  ',
-    ],
-    't': [
-
-
-        r'  | $$   ',
-        r' /$$$$$$ ',
-        r'|_  $$_/ ',
-        r'  | $$   ',
-        r'  |  $$$ ',
-        r'   \___/ ',
-    ],
-
-    'u': [
-        r' /$$   /$$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-    ],
-    'v': [
-
-        r' /$$    /$$ ',
-        r'|  $$  /$$/ ',
-        r' \  $$/$$/  ',
-        r'  \  $$$/   ',
-        r'   \  $/    ',
-        r'    \_/     '
-    ],
-    'w': [
-        r' /$$  /$$  /$$ ',
-        r'| $$ | $$ | $$ ',
-        r'| $$ | $$ | $$ ',
-        r'| $$ | $$ | $$ ',
-        r'|  $$$$$/$$$$/ ',
-        r' \_____\___/   ',
-    ],
-    
-    'x': [
-
-        r' /$$   /$$ ',
-        r'|  $$ /$$/ ',
-        r' \  $$$$/  ',
-        r'  >$$  $$  ',
-        r' /$$/\  $$ ',
-        r'|__/  \__/ ',
-    ],
-    'y': [
-        r' /$$   /$$ ',
-        r'| $$  | $$ ',
-        r'|  $$$$$$$ ',
-        r' \____  $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-   
-    ],
-    'z': [
-        r' /$$$$$$$$ ',
-        r'|____ /$$/ ',
-        r'   /$$$$/  ',
-        r'  /$$__/   ',
-        r' /$$$$$$$$ ',
-        r'|________/ '
-    ],
-    "0": [
-        r'  /$$$$$$  ',
-        r' /$$$_  $$ ',
-        r'| $$$$\ $$ ',
-        r'| $$ $$ $$ ',
-        r'| $$\ $$$$ ',
-        r'| $$ \ $$$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-
-    ],
-
-    "1": [
-        r'   /$$   ',
-        r' /$$$$   ',
-        r'|_  $$   ',
-        r'  | $$   ',
-        r'  | $$   ',
-        r'  | $$   ',
-        r' /$$$$$$ ',
-        r'|______/ ',
-
-    ],
-
-    "2": [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'|__/  \ $$ ',
-        r'  /$$$$$$/ ',
-        r' /$$____/  ',
-        r'| $$       ',
-        r'| $$$$$$$$ ',
-        r'|________/ ',
-
-    ],
-    "3": [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'|__/  \ $$ ',
-        r'   /$$$$$/ ',
-        r'  |___  $$ ',
-        r' /$$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-
-    ],
-    "4": [
-        r' /$$   /$$ ',
-        r'| $$  | $$ ',
-        r'| $$  | $$ ',
-        r'| $$$$$$$$ ',
-        r'|_____  $$ ',
-        r'      | $$ ',
-        r'      | $$ ',
-        r'      |__/ ',
-
-    ],
-    "5": [
-        r' /$$$$$$$  ',
-        r'| $$____/  ',
-        r'| $$       ',
-        r'| $$$$$$$  ',
-        r'|_____  $$ ',
-        r' /$$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-    ],
-    "6": [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \__/ ',
-        r'| $$$$$$$  ',
-        r'| $$__  $$ ',
-        r'| $$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-    
-    ],
-
-    "7": [
-        r' /$$$$$$$$ ',
-        r'|_____ $$/ ',
-        r'     /$$/  ',
-        r'    /$$/   ',
-        r'   /$$/    ',
-        r'  /$$/     ',
-        r' /$$/      ',
-        r'|__/       ',
-     
-    ],
-    "8": [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' >$$__  $$ ',
-        r'| $$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-
-    ],
-
-    "9": [
-        r'  /$$$$$$  ',
-        r' /$$__  $$ ',
-        r'| $$  \ $$ ',
-        r'|  $$$$$$$ ',
-        r' \____  $$ ',
-        r' /$$  \ $$ ',
-        r'|  $$$$$$/ ',
-        r' \______/  ',
-    
-    ],
- "'": [
-        r' /$$ ',
-        r'| $/ ',
-        r'|_/  ' ,
-        r'     ',
-        r'     ',
-        r'     ',
-        r'     ',
-        r'      ',
-    
-    ],  
-        
-}
+# Glyph table used by Home: GLYPHS[i] holds the HEIGHT rows of CHARS[i] joined by newlines, already padded
+# to full height. Stored as one tuple of string constants so loading it is a single unmarshal.
+
+HEIGHT = 8
+BLANK_WIDTH = 8
+CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'"
+GLYPHS = (
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\ $$ \n| $$$$$$$$ \n| $$__  $$ \n| $$  | $$ \n| $$  | $$ \n|__/  |__/',  # A
+    ' /$$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n| $$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n| $$$$$$$/ \n|_______/  ',  # B
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\__/ \n| $$       \n| $$       \n| $$    $$ \n|  $$$$$$/ \n \\______/  ',  # C
+    ' /$$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n| $$  | $$ \n| $$  | $$ \n| $$  | $$ \n| $$$$$$$/ \n|_______/  ',  # D
+    ' /$$$$$$$$ \n| $$_____/ \n| $$       \n| $$$$$    \n| $$__/    \n| $$       \n| $$$$$$$$ \n|________/ ',  # E
+    ' /$$$$$$$$ \n| $$_____/ \n| $$       \n| $$$$$    \n| $$__/    \n| $$       \n| $$       \n|__/       ',  # F
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\__/ \n| $$ /$$$$ \n| $$|_  $$ \n| $$  \\ $$ \n|  $$$$$$/ \n \\______/  ',  # G
+    ' /$$   /$$ \n| $$  | $$ \n| $$  | $$ \n| $$$$$$$$ \n| $$__  $$ \n| $$  | $$ \n| $$  | $$ \n|__/  |__/ ',  # H
+    ' /$$$$$$ \n|_  $$_/ \n  | $$   \n  | $$   \n  | $$   \n  | $$   \n /$$$$$$ \n|______/ ',  # I
+    '    /$$$$$ \n   |__  $$ \n      | $$ \n      | $$ \n /$$  | $$ \n| $$  | $$ \n|  $$$$$$/ \n \\______/  ',  # J
+    ' /$$   /$$ \n| $$  /$$/ \n| $$ /$$/  \n| $$$$$/   \n| $$  $$   \n| $$\\  $$  \n| $$ \\  $$ \n|__/  \\__/ ',  # K
+    ' /$$       \n| $$       \n| $$       \n| $$       \n| $$       \n| $$       \n| $$$$$$$$ \n|________/ ',  # L
+    ' /$$      /$$ \n| $$$    /$$$ \n| $$$$  /$$$$ \n| $$ $$/$$ $$ \n| $$  $$$| $$ \n| $$\\  $ | $$ \n| $$ \\/  | $$ \n|__/     |__/ ',  # M
+    ' /$$   /$$ \n| $$$ | $$ \n| $$$$| $$ \n| $$ $$ $$ \n| $$  $$$$ \n| $$\\  $$$ \n| $$ \\  $$ \n|__/  \\__/ ',  # N
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\ $$ \n| $$  | $$ \n| $$  | $$ \n| $$  | $$ \n|  $$$$$$/ \n \\______/  ',  # O
+    ' /$$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n| $$$$$$$/ \n| $$____/  \n| $$       \n| $$       \n|__/       ',  # P
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\ $$ \n| $$  | $$ \n| $$/$$ $$ \n|  $$$$$$/ \n \\____ $$$ \n      \\__/ ',  # Q
+    ' /$$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n| $$$$$$$/ \n| $$__  $$ \n| $$  \\ $$ \n| $$  | $$ \n|__/  |__/ ',  # R
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\__/ \n|  $$$$$$  \n \\____  $$ \n /$$  \\ $$ \n|  $$$$$$/ \n \\______/  ',  # S
+    ' /$$$$$$$$ \n|__  $$__/ \n   | $$    \n   | $$    \n   | $$    \n   | $$    \n   | $$    \n   |__/    ',  # T
+    ' /$$   /$$ \n| $$  | $$ \n| $$  | $$ \n| $$  | $$ \n| $$  | $$ \n| $$  | $$ \n|  $$$$$$/ \n \\______/  ',  # U
+    ' /$$    /$$ \n| $$   | $$ \n| $$   | $$ \n|  $$ / $$/ \n \\  $$ $$/  \n  \\  $$$/   \n   \\  $/    \n    \\_/     ',  # V
+    ' /$$      /$$ \n| $$  /$ | $$ \n| $$ /$$$| $$ \n| $$/$$ $$ $$ \n| $$$$_  $$$$ \n| $$$/ \\  $$$ \n| $$/   \\  $$ \n|__/     \\__/ ',  # W
+    ' /$$   /$$ \n| $$  / $$ \n|  $$/ $$/ \n \\  $$$$/  \n  >$$  $$  \n /$$/\\  $$ \n| $$  \\ $$ \n|__/  \\__/ ',  # X
+    ' /$$     /$$ \n|  $$   /$$/ \n \\  $$ /$$/  \n  \\  $$$$/   \n   \\  $$/    \n    | $$     \n    | $$     \n    |__/     ',  # Y
+    ' /$$$$$$$$ \n|_____ $$  \n     /$$/  \n    /$$/   \n   /$$/    \n  /$$/     \n /$$$$$$$$ \n|________/ ',  # Z
+    '        \n  /$$$$$$  \n |____  $$ \n  /$$$$$$$ \n /$$__  $$ \n|  $$$$$$$ \n \\_______/ \n        ',  # a
+    '        \n /$$       \n| $$       \n| $$$$$$$  \n| $$    $$ \n| $$$$$$$/ \n|_______/  \n        ',  # b
+    '        \n  /$$$$$$$ \n /$$_____/ \n| $$       \n| $$       \n|  $$$$$$$ \n \\_______/ \n        ',  # c
+    '        \n       /$$ \n      | $$ \n  /$$$$$$$ \n /$$    $$ \n|  $$$$$$$ \n \\_______/ \n        ',  # d
+    '        \n  /$$$$$$  \n /$$__  $$ \n| $$$$$$$$ \n| $$_____/ \n|  $$$$$$$ \n \\_______/ \n        ',  # e
+    '        \n  /$$$$$$  \n /$$__  $$ \n| $$  \\__/ \n| $$$$     \n| $$|      \n|___|      \n        ',  # f
+    '        \n  /$$$$$$  \n /$$    $$ \n|  $$$$$$$ \n \\____  $$ \n /$$  \\ $$ \n|  $$$$$$/ \n        ',  # g
+    '        \n /$$       \n| $$       \n| $$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n|__/  |__/ \n        ',  # h
+    '        \n /$$ \n|__/ \n /$$ \n| $$ \n| $$ \n|__/ \n        ',  # i
+    '        \n       /$$ \n      |__/ \n       /$$ \n /$$  | $$ \n|  $$$$$$/ \n \\______/  \n        ',  # j
+    '        \n /$$   /$$ \n| $$  /$$/ \n| $$$$$$/  \n| $$_  $$  \n| $$ \\  $$ \n|__/  \\__/ \n        ',  # k
+    '        \n /$$ \n| $$ \n| $$ \n| $$ \n| $$ \n|__/ \n        ',  # l
+    '        \n /$$$$$$/$$$$  \n| $$_  $$_  $$ \n| $$ \\ $$ \\ $$ \n| $$ | $$ | $$ \n| $$ | $$ | $$ \n|__/ |__/ |__/ \n        ',  # m
+    '        \n /$$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n| $$  | $$ \n| $$  | $$ \n|__/  |__/ \n        ',  # n
+    '        \n  /$$$$$$  \n /$$__  $$ \n| $$  \\ $$ \n| $$  | $$ \n|  $$$$$$/ \n \\______/  \n        ',  # o
+    '        \n  /$$$$$$  \n /$$    $$ \n| $$$$$$$/ \n| $$____/  \n| $$       \n|__/       \n        ',  # p
+    '        \n  /$$$$$$  \n /$$    $$ \n|  $$$$$$$ \n \\____  $$ \n      | $$ \n      |__/ \n        ',  # q
+    '        \n  /$$$$$$  \n /$$__  $$ \n| $$  \\__/ \n| $$       \n| $$       \n|__/       \n        ',  # r
+    '        \n  /$$$$$$$ \n /$$_____/ \n|  $$$$$$  \n \\____  $$ \n /$$$$$$$/ \n|_______/  \n        ',  # s
+    '        \n  | $$   \n /$$$$$$ \n|_  $$_/ \n  | $$   \n  |  $$$ \n   \\___/ \n        ',  # t
+    '        \n /$$   /$$ \n| $$  | $$ \n| $$  | $$ \n| $$  | $$ \n|  $$$$$$/ \n \\______/  \n        ',  # u
+    '        \n /$$    /$$ \n|  $$  /$$/ \n \\  $$/$$/  \n  \\  $$$/   \n   \\  $/    \n    \\_/     \n        ',  # v
+    '        \n /$$  /$$  /$$ \n| $$ | $$ | $$ \n| $$ | $$ | $$ \n| $$ | $$ | $$ \n|  $$$$$/$$$$/ \n \\_____\\___/   \n        ',  # w
+    '        \n /$$   /$$ \n|  $$ /$$/ \n \\  $$$$/  \n  >$$  $$  \n /$$/\\  $$ \n|__/  \\__/ \n        ',  # x
+    '        \n /$$   /$$ \n| $$  | $$ \n|  $$$$$$$ \n \\____  $$ \n|  $$$$$$/ \n \\______/  \n        ',  # y
+    '        \n /$$$$$$$$ \n|____ /$$/ \n   /$$$$/  \n  /$$__/   \n /$$$$$$$$ \n|________/ \n        ',  # z
+    '  /$$$$$$  \n /$$$_  $$ \n| $$$$\\ $$ \n| $$ $$ $$ \n| $$\\ $$$$ \n| $$ \\ $$$ \n|  $$$$$$/ \n \\______/  ',  # 0
+    '   /$$   \n /$$$$   \n|_  $$   \n  | $$   \n  | $$   \n  | $$   \n /$$$$$$ \n|______/ ',  # 1
+    '  /$$$$$$  \n /$$__  $$ \n|__/  \\ $$ \n  /$$$$$$/ \n /$$____/  \n| $$       \n| $$$$$$$$ \n|________/ ',  # 2
+    '  /$$$$$$  \n /$$__  $$ \n|__/  \\ $$ \n   /$$$$$/ \n  |___  $$ \n /$$  \\ $$ \n|  $$$$$$/ \n \\______/  ',  # 3
+    ' /$$   /$$ \n| $$  | $$ \n| $$  | $$ \n| $$$$$$$$ \n|_____  $$ \n      | $$ \n      | $$ \n      |__/ ',  # 4
+    ' /$$$$$$$  \n| $$____/  \n| $$       \n| $$$$$$$  \n|_____  $$ \n /$$  \\ $$ \n|  $$$$$$/ \n \\______/  ',  # 5
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\__/ \n| $$$$$$$  \n| $$__  $$ \n| $$  \\ $$ \n|  $$$$$$/ \n \\______/  ',  # 6
+    ' /$$$$$$$$ \n|_____ $$/ \n     /$$/  \n    /$$/   \n   /$$/    \n  /$$/     \n /$$/      \n|__/       ',  # 7
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\ $$ \n|  $$$$$$/ \n >$$__  $$ \n| $$  \\ $$ \n|  $$$$$$/ \n \\______/  ',  # 8
+    '  /$$$$$$  \n /$$__  $$ \n| $$  \\ $$ \n|  $$$$$$$ \n \\____  $$ \n /$$  \\ $$ \n|  $$$$$$/ \n \\______/  ',  # 9
+    ' /$$ \n| $/ \n|_/  \n     \n     \n     \n     \n      ',  # '
+)
+
+def __getattr__(name):
+    # Older code imported the glyph dict directly
+    if name == "ascii_art":
+        return {char: glyph.split("\n") for char, glyph in zip(CHARS, GLYPHS)}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
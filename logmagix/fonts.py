@@ -0,0 +1,111 @@
+import marshal
+import os
+
+CACHE_FORMAT = 1
+
+class Font:
+    __slots__ = ("name", "height", "glyphs", "_blank")
+
+    def __init__(self, name: str, height: int, glyphs: dict, blank_width: int = 8):
+        self.name = name
+        self.height = height
+        self.glyphs = glyphs
+        self._blank = (" " * blank_width,) * height
+
+    def glyph(self, char: str) -> tuple:
+        return self.glyphs.get(char, self._blank)
+
+_fonts = {}
+
+def _builtin_font() -> Font:
+    from . import font
+
+    return Font("default", font.HEIGHT, {char: tuple(glyph.split("\n")) for char, glyph in zip(font.CHARS, font.GLYPHS)}, font.BLANK_WIDTH)
+
+def _parse_code(code: str) -> int:
+    if code.lower().startswith(("0x", "-0x")):
+        return int(code, 16)
+    if code.startswith("0") and len(code) > 1:
+        return int(code, 8)
+    return int(code)
+
+def parse_flf(text: str) -> tuple[int, dict]:
+    # FIGlet font: header, comment lines, then one glyph per `height` lines for ASCII 32-126, the 7
+    # required Deutsch characters, and optional code-tagged glyphs. Glyphs are laid out at full width.
+    lines = text.splitlines()
+    header = lines[0].split()
+    if not header or not header[0].startswith("flf2a"):
+        raise ValueError("Not a FIGlet font (missing flf2a header)")
+    hardblank = header[0][5]
+    height, comment_lines = int(header[1]), int(header[5])
+
+    def read_glyph(start: int) -> tuple:
+        rows = []
+        for line in lines[start:start + height]:
+            line = line.rstrip()
+            if line:
+                line = line.rstrip(line[-1])
+            rows.append(line.replace(hardblank, " "))
+        if len(rows) < height:
+            raise ValueError("Truncated FIGlet font")
+        width = max(map(len, rows))
+        return tuple(row.ljust(width) for row in rows)
+
+    glyphs = {}
+    pos = 1 + comment_lines
+    for code in [*range(32, 127), 196, 214, 220, 228, 246, 252, 223]:
+        if pos + height > len(lines):
+            return height, glyphs
+        glyphs[chr(code)] = read_glyph(pos)
+        pos += height
+    while pos + height < len(lines) and lines[pos].strip():
+        try:
+            code = _parse_code(lines[pos].split()[0])
+        except ValueError:
+            break
+        if code >= 0:
+            glyphs[chr(code)] = read_glyph(pos + 1)
+        pos += height + 1
+    return height, glyphs
+
+def _cache_path(path: str) -> str:
+    import hashlib
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "logmagix", "fonts", hashlib.sha1(path.encode()).hexdigest()[:16] + ".bin")
+
+def _load_file(path: str) -> Font:
+    stat = os.stat(path)
+    stamp = (CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+    cache_path = _cache_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, height, glyphs, blank_width = marshal.load(f)
+        if tuple(cached_stamp) == stamp:
+            return Font(path, height, glyphs, blank_width)
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    with open(path, encoding="utf-8", errors="replace") as f:
+        height, glyphs = parse_flf(f.read())
+    blank_width = len(glyphs[" "][0]) if " " in glyphs else 1
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump((stamp, height, glyphs, blank_width), f)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+    return Font(path, height, glyphs, blank_width)
+
+def load_font(font: "str | Font | None" = None) -> Font:
+    # Fonts are only read when first used; FIGlet files are compiled once and reused from the disk cache
+    if isinstance(font, Font):
+        return font
+    key = "default" if font in (None, "default") else os.path.abspath(font)
+    loaded = _fonts.get(key)
+    if loaded is None:
+        loaded = _fonts[key] = _builtin_font() if key == "default" else _load_file(key)
+    return loaded
@@ -1,13 +1,23 @@
+import atexit
+import contextvars
 import datetime
 import time
-from threading import Thread
-from itertools import cycle
+from time import perf_counter_ns
+from types import SimpleNamespace
 from colorama import Fore, Style
 import os
+import sys
 import getpass
-from .font import *
-from pystyle import Write, System, Colors
+from .engine import AsyncEngine, LogRecord
+from .filters import Suppressor, make_sampler
+from .sinks import ConsoleSink, FileSink, JsonSink, flush_consoles
+from .templates import Template, TIMER_FIELDS
+from .terminal import renderer
+from .fonts import Font, load_font
+from .timing import LatencyHistogram, Timed
+from .metrics import MetricsWriter
 from enum import Enum
+from typing import Callable
 import re
 
 # Repository info tracking at module level
@@ -21,29 +31,117 @@ class LogLevel(Enum):
     FAILURE = 5
     CRITICAL = 6
 
+# Render/write time is measured for one record in 16; timing every record costs more than the rest of the counters
+TIMING_SAMPLE_MASK = 15
+
+# A replacement field of str.format(); {{ and }} are escaped braces, not fields
+_BRACE_FIELD = re.compile(r"(?<!\{)\{(?!\{)[^{}]*\}")
+
+def _format_message(message, args: tuple) -> str:
+    # Deferred until the level is known to be enabled: callables are called, args are interpolated.
+    # The style is picked from the message alone: {}-style if it has a replacement field, %-style otherwise,
+    # so a literal "%" in a {}-style message (e.g. "50% done") is never read as a conversion.
+    # A logging call never raises over its arguments: on error the raw message and args are logged instead.
+    try:
+        if callable(message):
+            message = message()
+        if not args:
+            return message
+        if not isinstance(message, str):
+            message = str(message)
+        if "{" in message and _BRACE_FIELD.search(message):
+            return message.format(*args)
+        return message % args
+    except Exception as e:
+        return f"{message} {args!r} (formatting failed: {type(e).__name__}: {e})"
+
+def _noop(*args, **kwargs) -> None:
+    # Shared stand-in for the level methods of disabled levels
+    return None
+
 class Logger:
+    # Per-kind line formats. {prefix}, {time}, {label}, {message} and {timer} are filled per call,
+    # every other field is a palette color that gets compiled into the template.
+    FORMATS: dict = {}
+    # Timer formats for kinds that don't use the default "timer" format; {elapsed} is end - start
+    TIMER_FORMATS: dict = {}
+    # Kinds that only redraw the current terminal line and never reach the log file
+    TRANSIENT_KINDS: tuple = ()
+    # Level methods and the level they log at; disabled ones are rebound to a no-op by set_level()
+    LEVEL_METHODS: dict = {}
+    # Kind and label for records logged by level alone, e.g. ones coming from stdlib logging
+    LEVEL_KINDS: dict = {}
+
     def __new__(cls, style: int = 1, *args, **kwargs):
+        # Pick the concrete class here and let type.__call__ run __init__ exactly once
         if cls is Logger:
-            if style == 2:
-                return SimpleLogger(*args, **kwargs)
-            return ColorLogger(*args, **kwargs)
+            cls = SimpleLogger if style == 2 else ColorLogger
         return super().__new__(cls)
         
-    def __init__(self, style: int = 1, prefix: str | None = "discord.cyberious.xyz", github_repository: str = None, level: LogLevel = LogLevel.DEBUG, log_file: str | None = None):
+    def __init__(self, style: int = 1, prefix: str | None = "discord.cyberious.xyz", github_repository: str = None, level: LogLevel = LogLevel.DEBUG, log_file: str | FileSink | None = None,
+                 async_mode: bool = False, queue_size: int = 10000, overflow: str = "block", formats: dict | None = None,
+                 json_file: str | JsonSink | None = None, console: bool | ConsoleSink = True,
+                 dedup_window: float | None = None, dedup_max_keys: int = 1024, rate_limits: dict | None = None, sampling: dict | None = None,
+                 check_updates: bool = True, metrics_file: str | None = None, metrics_interval: float = 15.0,
+                 ring_file: "str | RingBufferSink | None" = None, ring_size: int = 4 * 1024 * 1024):
         global _repository_info_displayed
         
         self.level = level
         self.repo_url = github_repository
-        self.log_file = log_file
         self.prefix = prefix
+        self._prefix_name = prefix
+        self._engine = None
+        self._console = console if isinstance(console, ConsoleSink) else ConsoleSink()
+        self._file_sink = None
+        self._time_cache = (None, "")
+        self._timings = {}
+        # Self-metrics, updated without locks; see stats()
+        # Indexed by LogLevel value: hashing an Enum member runs Python code, indexing a list does not
+        self._lines = [0] * (max(level.value for level in LogLevel) + 1)
+        self._sampled_out = 0
+        self._writes = 0
+        self._format_ns = 0
+        self._write_ns = 0
 
-        if log_file:
-            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        unknown = set(formats or ()) - set(self.FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown log format(s): {', '.join(sorted(unknown))}")
+        self.formats = {**self.FORMATS, **(formats or {})}
+        self._palettes = self._build_palettes(self._colors())
+        self._prefixes = {color: self._render_prefix(c, prefix) for color, c in self._palettes.items()}
+        self._compile_templates()
+
+        if isinstance(log_file, FileSink):
+            self._file_sink = log_file
+        elif log_file:
+            self._file_sink = FileSink(log_file)
+        self.log_file = self._file_sink.path if self._file_sink else None
+        self._json_sink = json_file if isinstance(json_file, JsonSink) else JsonSink(json_file) if json_file else None
+        self._ring_sink = None
+        if ring_file:
+            from .ring import RingBufferSink
+            self._ring_sink = ring_file if isinstance(ring_file, RingBufferSink) else RingBufferSink(ring_file, ring_size)
+        self._sinks = [sink for sink in (self._console if console else None, self._file_sink, self._json_sink, self._ring_sink) if sink]
+
+        if self._file_sink:
             self._write_to_log(f"=== Logging started at {datetime.datetime.now()} ===\n")
-        
-        from .updater import AutoUpdater
-        updater = AutoUpdater("logmagix", self)
-        updater.check_for_updates()
+
+        self._samplers = {level: make_sampler(spec) for level, spec in (sampling or {}).items()}
+        self._suppressor = None
+        if dedup_window or rate_limits:
+            self._suppressor = Suppressor(self._emit_summary, dedup_window, dedup_max_keys, rate_limits)
+
+        self._queue_size = queue_size
+        self._overflow = overflow
+        if async_mode:
+            self._start_engine()
+
+        self._metrics = MetricsWriter(self, metrics_file, metrics_interval) if metrics_file else None
+
+        if check_updates:
+            from .updater import AutoUpdater
+            updater = AutoUpdater("logmagix", self)
+            updater.check_for_updates()
 
     def _extract_github_username(self, url: str) -> str | None:
         url = url.replace('https://', '').replace('http://', '').replace('www.', '')
@@ -58,24 +156,291 @@ class Logger:
             
         return None
 
+    def _colors(self) -> dict:
+        return {}
+
+    def _render_prefix(self, c: SimpleNamespace, prefix: str | None) -> str:
+        return ""
+
+    def _render_context(self, c: SimpleNamespace, fields: dict) -> str:
+        return ""
+
+    def _build_palettes(self, colors: dict) -> dict:
+        # The colorless palette has the same fields, all empty, so one format pass yields the plain line
+        return {True: SimpleNamespace(**colors), False: SimpleNamespace(**dict.fromkeys(colors, ""))}
+
+    def _compile_templates(self) -> None:
+        self._templates = {}
+        for color, c in self._palettes.items():
+            static = vars(c)
+            default_timer = Template(self.formats["timer"], static, TIMER_FIELDS).render
+            self._templates[color] = {
+                kind: (Template(source, static).render,
+                       Template(self.TIMER_FORMATS[kind], static, TIMER_FIELDS).render if kind in self.TIMER_FORMATS else default_timer)
+                for kind, source in self.formats.items() if kind != "timer"
+            }
+
+    def _render(self, record: LogRecord, color: bool) -> str:
+        line, timer = self._templates[color][record.kind]
+        timer_text = timer(record.end - record.start) if record.start and record.end else ""
+        if record.sample_rate:
+            timer_text += f" [sample_rate={record.sample_rate:g}]"
+        prefix = record.context[1][color] if record.context else self._prefixes[color]
+        return line(prefix, self._format_time(record.created), record.label, record.message, timer_text)
+
     def _write_to_log(self, message: str) -> None:
-        if self.log_file:
+        if self._file_sink:
             try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    clean_message = self._strip_ansi(message)
-                    f.write(clean_message + '\n')
+                self._file_sink.write(message)
             except Exception as e:
                 print(f"Error writing to log file: {e}")
 
-    def _strip_ansi(self, text: str) -> str:
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+    def get_time(self, created: float | None = None) -> str:
+        moment = datetime.datetime.fromtimestamp(created) if created else datetime.datetime.now()
+        return moment.strftime("%H:%M:%S")
+
+    def _format_time(self, created: float) -> str:
+        # Lines logged within the same second share one strftime call
+        second = int(created)
+        cached = self._time_cache
+        if cached[0] != second:
+            cached = self._time_cache = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+        return cached[1]
+
+    @property
+    def level(self) -> LogLevel:
+        return self._level
 
-    def get_time(self) -> str:
-        return datetime.datetime.now().strftime("%H:%M:%S")
+    @level.setter
+    def level(self, level: LogLevel) -> None:
+        self.set_level(level)
+
+    def set_level(self, level: LogLevel) -> None:
+        self._level = level
+        for name, method_level in self.LEVEL_METHODS.items():
+            if method_level.value >= level.value:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, _noop)
+
+    # _value_ is a plain attribute, unlike the Enum.value descriptor, which keeps these checks cheap
+    def is_enabled(self, level: LogLevel) -> bool:
+        return level._value_ >= self._level._value_
 
     def _should_log(self, message_level: LogLevel) -> bool:
-        return message_level.value >= self.level.value
+        return message_level._value_ >= self._level._value_
+
+    def _log(self, level: LogLevel, kind: str, label: str | None, message: str | Callable[[], str], args: tuple = (), start: float = None, end: float = None,
+             fields: dict | None = None) -> None:
+        sample_rate = None
+        if self._samplers:
+            # Decided before the message is formatted; frame 2 is the caller of the level method
+            sampler = self._samplers.get(level)
+            if sampler:
+                site = None
+                if sampler.needs_site:
+                    frame = sys._getframe(2)
+                    if frame.f_code is _BOUND_CODE or frame.f_code is _ASYNC_CODE:
+                        frame = frame.f_back
+                    site = (frame.f_code, frame.f_lineno)
+                sample_rate = sampler.sample(site)
+                if sample_rate is None:
+                    self._sampled_out += 1
+                    return
+        if args or callable(message):
+            message = _format_message(message, args)
+        if self._suppressor and not self._suppressor.admit(level, kind, label, message, fields.pop("dedup_key", None) if fields else None):
+            return
+        # A BoundLogger passes itself under _CONTEXT; otherwise the one set by contextualize() applies, if any
+        context = None
+        view = fields.pop(_CONTEXT, None) if fields else None
+        if view is None:
+            scoped = _scoped.get()
+            view = scoped.get(self) if scoped else None
+        if view is not None:
+            context = view._context or view._render_context()
+            fields = {**view._fields, **fields} if fields else view._fields
+        record = LogRecord(kind, label, message, start, end, level, fields)
+        if context:
+            record.context = context
+        if sample_rate is not None and sample_rate < 1:
+            record.sample_rate = sample_rate
+        self._dispatch(record)
+
+    def _emit_summary(self, level: LogLevel, kind: str, label: str | None, message: str) -> None:
+        self._dispatch(LogRecord(kind, label, message, level=level))
+
+    def _dispatch(self, record: LogRecord) -> None:
+        if record.level:
+            self._lines[record.level._value_] += 1
+        if self._engine:
+            self._engine.put(record)
+        else:
+            self._handle(record)
+
+    def _structured(self, record: LogRecord) -> dict:
+        data = {
+            "timestamp": record.created,
+            "time": datetime.datetime.fromtimestamp(record.created).astimezone().isoformat(),
+            "level": record.level.name if record.level else None,
+            "label": record.label,
+            "message": record.message,
+            "prefix": record.context[0] if record.context else self._prefix_name,
+        }
+        if record.start and record.end:
+            data["elapsed"] = record.end - record.start
+        if record.sample_rate:
+            data["sample_rate"] = record.sample_rate
+        if record.fields:
+            for key, value in record.fields.items():
+                data.setdefault(key, value)
+        return data
+
+    def _handle(self, record: LogRecord) -> None:
+        if record.kind in self.TRANSIENT_KINDS:
+            if self._console in self._sinks:
+                self._console.write(self._render(record, True), end="\r")
+            return
+        self._write_sinks(record, self._sinks)
+
+    def _write_sinks(self, record: LogRecord, sinks: list) -> None:
+        # Render each form (colored/plain/structured) at most once, and only if a sink wants it
+        self._writes += 1
+        if not self._writes & TIMING_SAMPLE_MASK:
+            self._write_sinks_timed(record, sinks)
+            return
+        lines = {}
+        for sink in sinks:
+            line = lines.get(sink.color)
+            if line is None:
+                line = lines[sink.color] = self._structured(record) if sink.color is None else self._render(record, sink.color)
+            try:
+                sink.write(line)
+            except Exception as e:
+                print(f"Error writing to log sink: {e}")
+
+    def _write_sinks_timed(self, record: LogRecord, sinks: list) -> None:
+        # Same as _write_sinks, also adding up render and write time; used for one record in TIMING_SAMPLE_MASK + 1
+        lines = {}
+        for sink in sinks:
+            line = lines.get(sink.color)
+            started = perf_counter_ns()
+            if line is None:
+                line = lines[sink.color] = self._structured(record) if sink.color is None else self._render(record, sink.color)
+                rendered = perf_counter_ns()
+                self._format_ns += rendered - started
+                started = rendered
+            try:
+                sink.write(line)
+            except Exception as e:
+                print(f"Error writing to log sink: {e}")
+            self._write_ns += perf_counter_ns() - started
+
+    def _emit_line(self, record: LogRecord) -> None:
+        # Interactive lines are printed by the caller; this counts them and echoes them to every other sink
+        self._lines[record.level._value_] += 1
+        self._write_sinks(record, [sink for sink in self._sinks if sink is not self._console])
+
+    def bind(self, **fields) -> "BoundLogger":
+        # Inside contextualize() the new view starts from the scoped fields
+        scoped = _scoped.get()
+        view = scoped.get(self) if scoped else None
+        if view is not None:
+            return view.bind(**fields)
+        return BoundLogger(self, self._prefix_name, fields)
+
+    def contextualize(self, **fields) -> "Contextualize":
+        return Contextualize(self, fields)
+
+    def _start_engine(self) -> AsyncEngine:
+        self._engine = AsyncEngine(self._handle, maxsize=self._queue_size, overflow=self._overflow)
+        atexit.register(self.close)
+        return self._engine
+
+    async def aquestion(self, *args, **kwargs) -> str:
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: self.question(*args, **kwargs))
+
+    async def aflush(self) -> None:
+        import asyncio
+
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def child(self, prefix: str | None) -> "BoundLogger":
+        return BoundLogger(self, prefix, {})
+
+    def timed(self, name: str, level: LogLevel = LogLevel.INFO, log: bool = True) -> Timed:
+        return Timed(self, name, level, log)
+
+    def _record_timing(self, name: str, start_ns: int, end_ns: int, level: LogLevel, log: bool) -> None:
+        histogram = self._timings.get(name)
+        if histogram is None:
+            histogram = self._timings.setdefault(name, LatencyHistogram())
+        histogram.record(end_ns - start_ns)
+        if log and self.is_enabled(level):
+            self._log(level, "timed", "Timer", name, start=start_ns / 1e9, end=end_ns / 1e9)
+
+    def timing_report(self, show: bool = True) -> str:
+        header = ("Name", "Count", "Total s", "Mean ms", "p50 ms", "p95 ms", "p99 ms", "Max ms")
+        rows = [header]
+        for name, histogram in sorted(self._timings.items(), key=lambda item: -item[1].total):
+            count = histogram.count
+            rows.append((name, str(count), f"{histogram.total / 1e9:.3f}", f"{histogram.total / count / 1e6:.3f}",
+                         *(f"{histogram.percentile(q) / 1e6:.3f}" for q in (50, 95, 99)), f"{histogram.max / 1e6:.3f}"))
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        report = "\n".join("  ".join(cell.ljust(width) if i == 0 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths)))
+                           for row in rows)
+        if show:
+            self.flush()
+            flush_consoles()
+            print(report)
+        return report
+
+    def stats(self) -> dict:
+        engine = self._engine
+        return {
+            "lines": {level.name: self._lines[level.value] for level in LogLevel},
+            "sinks": {f"{type(sink).__name__}:{sink.path}" if hasattr(sink, "path") else type(sink).__name__: getattr(sink, "bytes_written", 0)
+                      for sink in self._sinks},
+            "dropped": getattr(engine, "dropped", 0),
+            "suppressed": self._suppressor.suppressed if self._suppressor else 0,
+            "sampled_out": self._sampled_out,
+            "queue_depth": engine.pending if isinstance(engine, AsyncEngine) else 0,
+            "queue_high_water": getattr(engine, "high_water", 0),
+            # Estimated from the sampled records
+            "format_seconds": self._format_ns * (TIMING_SAMPLE_MASK + 1) / 1e9,
+            "write_seconds": self._write_ns * (TIMING_SAMPLE_MASK + 1) / 1e9,
+        }
+
+    def flush(self) -> None:
+        if self._suppressor:
+            self._suppressor.flush()
+        if self._engine:
+            self._engine.flush()
+        for sink in self._sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        if self._suppressor:
+            self._suppressor.close()
+        if isinstance(self._engine, AsyncEngine):
+            # Detached before it stops, so lines logged after close() (atexit handlers, daemon threads) are
+            # written inline instead of queued with no writer
+            engine, self._engine = self._engine, None
+            engine.close()
+        elif self._engine:
+            self._engine.close()
+        for sink in self._sinks:
+            sink.close()
+        if self._metrics:
+            self._metrics.close()
+            self._metrics = None
+
+    def reopen(self) -> None:
+        for sink in self._sinks:
+            if isinstance(sink, FileSink):
+                sink.reopen()
         
     def display_repo_info(self):
         global _repository_info_displayed
@@ -89,6 +454,35 @@ class Logger:
             _repository_info_displayed = True
 
 class ColorLogger(Logger):
+    _HEAD = "{prefix}[{BRIGHT_MAGENTA}{time}{PINK}]"
+    FORMATS = {
+        "success": _HEAD + " {PINK}[{CYAN}{GREEN}{label}{PINK}] -> {CYAN}{GREEN}{message}{RESET}{timer}",
+        "failure": _HEAD + " {PINK}[{CYAN}{RED}{label}{PINK}] -> {CYAN}{RED}{message}{RESET}{timer}",
+        "warning": _HEAD + " {PINK}[{CYAN}{YELLOW}{label}{PINK}] -> {CYAN}{YELLOW}{message}{RESET}{timer}",
+        "message": _HEAD + " [{CYAN}{label}{PINK}] -> [{CYAN}{message}{PINK}]{timer}",
+        "message2": _HEAD + " {PINK}[{FORE_BLUE}{label}{PINK}] -> {RESET} {CYAN}{message}{RESET}",
+        "message2_timed": _HEAD + " {PINK}[{CYAN}{label}{PINK}] -> {RESET} {CYAN}{message}{RESET}{timer}",
+        "question": _HEAD + "{RESET} {PINK}[{FORE_BLUE}{label}{PINK}] -> {RESET} {CYAN}{message}{RESET}",
+        "critical": _HEAD + "{RESET} {PINK}[{RED}{label}{PINK}] -> {LIGHT_CORAL}{message}{RESET}{timer}",
+        "info": _HEAD + "{RESET} {PINK}[{FORE_BLUE}{label}{PINK}] -> {RESET} {CYAN}{message}{RESET}{timer}",
+        "debug": _HEAD + "{RESET} {PINK}[{FORE_YELLOW}{label}{PINK}] -> {RESET} {GREEN}{message}{RESET}{timer}",
+        "timed": _HEAD + "{RESET} {PINK}[{FORE_BLUE}{label}{PINK}] -> {RESET} {CYAN}{message}{RESET}{timer}",
+        "timer": " {BRIGHT_MAGENTA}In{WHITE} -> {BRIGHT_MAGENTA}{elapsed!s:.5} Seconds {RESET}",
+    }
+    TIMER_FORMATS = {
+        "message2_timed": " [{FORE_CYAN}{elapsed}s{RESET_ALL}]",
+        "timed": " {BRIGHT_MAGENTA}In{WHITE} -> {BRIGHT_MAGENTA}{elapsed:.6f} Seconds {RESET}",
+    }
+    TRANSIENT_KINDS = ("message2", "message2_timed")
+    LEVEL_METHODS = {
+        "success": LogLevel.SUCCESS, "failure": LogLevel.FAILURE, "error": LogLevel.FAILURE, "warning": LogLevel.WARNING,
+        "critical": LogLevel.CRITICAL, "info": LogLevel.INFO, "debug": LogLevel.DEBUG,
+    }
+    LEVEL_KINDS = {
+        LogLevel.DEBUG: ("debug", "DEBUG"), LogLevel.INFO: ("info", "!"), LogLevel.WARNING: ("warning", "Warning"),
+        LogLevel.SUCCESS: ("success", "Success"), LogLevel.FAILURE: ("failure", "Error"), LogLevel.CRITICAL: ("critical", "CRITICAL"),
+    }
+
     def __init__(self, *args, **kwargs):
         self.WHITE = "\u001b[37m"
         self.MAGENTA = "\033[38;5;97m"
@@ -101,154 +495,286 @@ class ColorLogger(Logger):
         self.PINK = "\033[38;5;176m"
         self.CYAN = "\033[96m"
         super().__init__(*args, **kwargs)
-        self.prefix = f"{self.PINK}[{self.MAGENTA}{self.prefix}{self.PINK}] " if self.prefix else f"{self.PINK}"
+        self.prefix = self._prefixes[True]
         
         # Display repo info after initializing colors
         self.display_repo_info()
 
+    def _colors(self) -> dict:
+        return {
+            "WHITE": self.WHITE, "MAGENTA": self.MAGENTA, "BRIGHT_MAGENTA": self.BRIGHT_MAGENTA, "LIGHT_CORAL": self.LIGHT_CORAL,
+            "RED": self.RED, "GREEN": self.GREEN, "YELLOW": self.YELLOW, "BLUE": self.BLUE, "PINK": self.PINK, "CYAN": self.CYAN,
+            "FORE_BLUE": Fore.BLUE, "FORE_YELLOW": Fore.YELLOW, "FORE_CYAN": Fore.CYAN, "RESET": Fore.RESET, "RESET_ALL": Style.RESET_ALL,
+        }
+
+    def _render_prefix(self, c: SimpleNamespace, prefix: str | None) -> str:
+        return f"{c.PINK}[{c.MAGENTA}{prefix}{c.PINK}] " if prefix else f"{c.PINK}"
+
+    def _render_context(self, c: SimpleNamespace, fields: dict) -> str:
+        return "".join(f"{c.PINK}[{c.CYAN}{key}={value}{c.PINK}] " for key, value in fields.items())
+
     def message3(self, level: str, message: str, start: int = None, end: int = None) -> str:
         current_time = self.get_time()
         return f"{self.prefix}[{self.BRIGHT_MAGENTA}{current_time}{self.PINK}] {self.PINK}[{self.CYAN}{level}{self.PINK}] -> {self.CYAN}{message}{Fore.RESET}"
 
-    def success(self, message: str, start: int = None, end: int = None, level: str = "Success") -> None:
+    def success(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "Success", **fields) -> None:
         if self._should_log(LogLevel.SUCCESS):
-            timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-            log_message = self.message3(f"{self.GREEN}{level}", f"{self.GREEN}{message}", start, end) + timer
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.SUCCESS, "success", level, message, args, start, end, fields)
 
-    def failure(self, message: str, start: int = None, end: int = None, level: str = "Failure") -> None:
+    def failure(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "Failure", **fields) -> None:
         if self._should_log(LogLevel.FAILURE):
-            timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-            log_message = self.message3(f"{self.RED}{level}", f"{self.RED}{message}", start, end) + timer
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.FAILURE, "failure", level, message, args, start, end, fields)
     
-    def error(self, message: str, start: int = None, end: int = None, level: str = "Error") -> None:
+    def error(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "Error", **fields) -> None:
         if self._should_log(LogLevel.FAILURE):
-            timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-            log_message = self.message3(f"{self.RED}{level}", f"{self.RED}{message}", start, end) + timer
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.FAILURE, "failure", level, message, args, start, end, fields)
     
-    def warning(self, message: str, start: int = None, end: int = None, level: str = "Warning") -> None:
+    def warning(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "Warning", **fields) -> None:
         if self._should_log(LogLevel.WARNING):
-            timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-            log_message = self.message3(f"{self.YELLOW}{level}", f"{self.YELLOW}{message}", start, end) + timer
-            print(log_message)
-            self._write_to_log(log_message)
-
-    def message(self, level: str, message: str, start: int = None, end: int = None) -> None:
-        timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-        log_message = f"{self.prefix}[{self.BRIGHT_MAGENTA}{self.get_time()}{self.PINK}] [{self.CYAN}{level}{self.PINK}] -> [{self.CYAN}{message}{self.PINK}]{timer}"
-        print(log_message)
-        self._write_to_log(log_message)
+            self._log(LogLevel.WARNING, "warning", level, message, args, start, end, fields)
+
+    def message(self, level: str, message: str | Callable[[], str], *args, start: int = None, end: int = None, **fields) -> None:
+        self._log(LogLevel.INFO, "message", level, message, args, start, end, fields)
     
-    def message2(self, level: str, message: str, start: int = None, end: int = None) -> None: 
-        if start and end:
-            print(f"{self.prefix}[{self.BRIGHT_MAGENTA}{self.get_time()}{self.PINK}] {self.PINK}[{self.CYAN}{level}{self.PINK}] -> {Fore.RESET} {self.CYAN}{message}{Fore.RESET} [{Fore.CYAN}{end - start}s{Style.RESET_ALL}]", end="\r")
-        else:
-            print(f"{self.prefix}[{self.BRIGHT_MAGENTA}{self.get_time()}{self.PINK}] {self.PINK}[{Fore.BLUE}{level}{self.PINK}] -> {Fore.RESET} {self.CYAN}{message}{Fore.RESET}", end="\r")
+    def message2(self, level: str, message: str | Callable[[], str], *args, start: int = None, end: int = None, **fields) -> None: 
+        self._log(LogLevel.INFO, "message2_timed" if start and end else "message2", level, message, args, start, end, fields)
 
     def question(self, message: str, start: int = None, end: int = None) -> None:
-        question_message = f"{self.prefix}[{self.BRIGHT_MAGENTA}{self.get_time()}{self.PINK}]{Fore.RESET} {self.PINK}[{Fore.BLUE}?{self.PINK}] -> {Fore.RESET} {self.CYAN}{message}{Fore.RESET}"
-        print(question_message, end='')
-        i = input()
-        self._write_to_log(f"{question_message}")
+        self.flush()
+        flush_consoles()
+        record = LogRecord("question", "?", message, level=LogLevel.INFO)
+        if self._console in self._sinks:
+            self._console.write(self._render(record, True), end='')
+            i = input()
+            self._emit_line(record)
+        else:
+            self._dispatch(record)
+            i = input()
         self._write_to_log(f"User Answer: {i}")
         
         return i
 
-    def critical(self, message: str, start: int = None, end: int = None, level: str = "CRITICAL", exit_code: int = 1) -> None:
+    def critical(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "CRITICAL", exit_code: int = 1, **fields) -> None:
         if self._should_log(LogLevel.CRITICAL):
-            timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-            log_message = f"{self.prefix}[{self.BRIGHT_MAGENTA}{self.get_time()}{self.PINK}]{Fore.RESET} {self.PINK}[{self.RED}{level}{self.PINK}] -> {self.LIGHT_CORAL}{message}{Fore.RESET}" + timer
-            print(log_message)
-            input()
-            self._write_to_log(log_message)
+            self.flush()
+            flush_consoles()
+            view = fields.pop(_CONTEXT, None)
+            if view is not None:
+                fields = {**view._fields, **fields}
+            record = LogRecord("critical", level, _format_message(message, args), start, end, LogLevel.CRITICAL, fields)
+            record.context = (view._context or view._render_context()) if view is not None else None
+            if self._console in self._sinks:
+                self._console.write(self._render(record, True))
+                input()
+                self._emit_line(record)
+            else:
+                # No console to wait on (console=False, or a worker forwarding to a LogListener): the line goes
+                # through the sinks like any other and the program exits right away
+                self._dispatch(record)
             self._write_to_log(f"=== Program terminated with exit code {exit_code} at {datetime.datetime.now()} ===")
+            self.close()
             exit(exit_code)
 
-    def info(self, message: str, start: int = None, end: int = None) -> None:
+    def info(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, **fields) -> None:
         if self._should_log(LogLevel.INFO):
-            timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-            log_message = f"{self.prefix}[{self.BRIGHT_MAGENTA}{self.get_time()}{self.PINK}]{Fore.RESET} {self.PINK}[{Fore.BLUE}!{self.PINK}] -> {Fore.RESET} {self.CYAN}{message}{Fore.RESET}" + timer
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.INFO, "info", "!", message, args, start, end, fields)
     
-    def debug(self, message: str, start: int = None, end: int = None) -> None:
+    def debug(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, **fields) -> None:
         if self._should_log(LogLevel.DEBUG):
-            timer = f" {self.BRIGHT_MAGENTA}In{self.WHITE} -> {self.BRIGHT_MAGENTA}{str(end - start)[:5]} Seconds {Fore.RESET}" if start and end else ""
-            log_message = f"{self.prefix}[{self.BRIGHT_MAGENTA}{self.get_time()}{self.PINK}]{Fore.RESET} {self.PINK}[{Fore.YELLOW}DEBUG{self.PINK}] -> {Fore.RESET} {self.GREEN}{message}{Fore.RESET}" + timer
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.DEBUG, "debug", "DEBUG", message, args, start, end, fields)
 
 class SimpleLogger(Logger):
+    _HEAD = "{BLACK}{time} » {RESET}{prefix}"
+    FORMATS = {
+        "success": _HEAD + "{LIGHTGREEN_EX}{label} {BLACK}➔ {RESET} {message}{timer}",
+        "failure": _HEAD + "{LIGHTRED_EX}{label} {BLACK}  ➔ {RESET} {message}{timer}",
+        "warning": _HEAD + "{LIGHTYELLOW_EX}{label} {BLACK}➔ {RESET} {message}{timer}",
+        "message": _HEAD + "{LIGHTMAGENTA_EX}{label} {BLACK}➔ {RESET} {message}{timer}",
+        "info": _HEAD + "{LIGHTBLUE_EX}{label} {BLACK}   ➔ {RESET} {message}{timer}",
+        "debug": _HEAD + "{GREEN}[{YELLOW}{label}{GREEN}] {BLACK}➔ {RESET} {message}{timer}",
+        "question": _HEAD + "{LIGHTCYAN_EX}{label} {BLACK}➔ {RESET} {message}",
+        "timed": _HEAD + "{LIGHTBLUE_EX}{label} {BLACK}➔ {RESET} {message}{timer}",
+        "timer": " (In {elapsed!s:.5}s)",
+    }
+    TIMER_FORMATS = {
+        "timed": " (In {elapsed:.6f}s)",
+    }
+    LEVEL_METHODS = {
+        "success": LogLevel.SUCCESS, "failure": LogLevel.FAILURE, "error": LogLevel.FAILURE, "warning": LogLevel.WARNING,
+        "message": LogLevel.WARNING, "info": LogLevel.INFO, "debug": LogLevel.DEBUG,
+    }
+    LEVEL_KINDS = {
+        LogLevel.DEBUG: ("debug", "DEBUG"), LogLevel.INFO: ("info", "INFO"), LogLevel.WARNING: ("warning", "WARNING"),
+        LogLevel.SUCCESS: ("success", "SUCCESS"), LogLevel.FAILURE: ("failure", "ERROR"), LogLevel.CRITICAL: ("failure", "CRITICAL"),
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.prefix = f"{Fore.BLACK}{self.get_time()} » {Fore.RESET}"
         
         # Display repo info after initializing prefix
         self.display_repo_info()
 
-    def success(self, message: str, start: int = None, end: int = None, level: str = "SUCCESS") -> None:
+    def _colors(self) -> dict:
+        return {
+            "BLACK": Fore.BLACK, "GREEN": Fore.GREEN, "YELLOW": Fore.YELLOW, "LIGHTGREEN_EX": Fore.LIGHTGREEN_EX, "LIGHTRED_EX": Fore.LIGHTRED_EX,
+            "LIGHTYELLOW_EX": Fore.LIGHTYELLOW_EX, "LIGHTMAGENTA_EX": Fore.LIGHTMAGENTA_EX, "LIGHTBLUE_EX": Fore.LIGHTBLUE_EX,
+            "LIGHTCYAN_EX": Fore.LIGHTCYAN_EX, "RESET": Fore.RESET,
+        }
+
+    def _render_prefix(self, c: SimpleNamespace, prefix: str | None) -> str:
+        # This style doesn't show the logger's own prefix; a different one set with child() goes before the label
+        return f"{c.LIGHTMAGENTA_EX}{prefix} {c.BLACK}» {c.RESET}" if prefix and prefix != self._prefix_name else ""
+
+    def _render_context(self, c: SimpleNamespace, fields: dict) -> str:
+        return "".join(f"{c.LIGHTCYAN_EX}{key}={value}{c.RESET} " for key, value in fields.items())
+
+    def success(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "SUCCESS", **fields) -> None:
         if self._should_log(LogLevel.SUCCESS):
-            timer = f" (In {str(end - start)[:5]}s)" if start and end else ""
-            log_message = f"{self.prefix}{Fore.LIGHTGREEN_EX}{level} {Fore.BLACK}➔ {Fore.RESET} {message}{timer}"
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.SUCCESS, "success", level, message, args, start, end, fields)
 
-    def failure(self, message: str, start: int = None, end: int = None, level: str = "FAILURE") -> None:
+    def failure(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "FAILURE", **fields) -> None:
         if self._should_log(LogLevel.FAILURE):
-            timer = f" (In {str(end - start)[:5]}s)" if start and end else ""
-            log_message = f"{self.prefix}{Fore.LIGHTRED_EX}{level} {Fore.BLACK}  ➔ {Fore.RESET} {message}{timer}"
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.FAILURE, "failure", level, message, args, start, end, fields)
 
-    def error(self, message: str, start: int = None, end: int = None, level: str = "ERROR") -> None:
+    def error(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "ERROR", **fields) -> None:
         if self._should_log(LogLevel.FAILURE):
-            timer = f" (In {str(end - start)[:5]}s)" if start and end else ""
-            log_message = f"{self.prefix}{Fore.LIGHTRED_EX}{level} {Fore.BLACK}  ➔ {Fore.RESET} {message}{timer}"
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.FAILURE, "failure", level, message, args, start, end, fields)
 
-    def warning(self, message: str, start: int = None, end: int = None, level: str = "WARNING") -> None:
+    def warning(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "WARNING", **fields) -> None:
         if self._should_log(LogLevel.WARNING):
-            timer = f" (In {str(end - start)[:5]}s)" if start and end else ""
-            log_message = f"{self.prefix}{Fore.LIGHTYELLOW_EX}{level} {Fore.BLACK}➔ {Fore.RESET} {message}{timer}"
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.WARNING, "warning", level, message, args, start, end, fields)
     
-    def message(self, message: str, start: int = None, end: int = None, level: str = "MESSAGE") -> None:
+    def message(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "MESSAGE", **fields) -> None:
         if self._should_log(LogLevel.WARNING):
-            timer = f" (In {str(end - start)[:5]}s)" if start and end else ""
-            log_message = f"{self.prefix}{Fore.LIGHTMAGENTA_EX}{level} {Fore.BLACK}➔ {Fore.RESET} {message}{timer}"
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.WARNING, "message", level, message, args, start, end, fields)
 
-    def info(self, message: str, start: int = None, end: int = None, level: str = "INFO") -> None:
+    def info(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, level: str = "INFO", **fields) -> None:
         if self._should_log(LogLevel.INFO):
-            timer = f" (In {str(end - start)[:5]}s)" if start and end else ""
-            log_message = f"{self.prefix}{Fore.LIGHTBLUE_EX}{level} {Fore.BLACK}   ➔ {Fore.RESET} {message}{timer}"
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.INFO, "info", level, message, args, start, end, fields)
 
-    def debug(self, message: str, start: int = None, end: int = None) -> None:
+    def debug(self, message: str | Callable[[], str], *args, start: int = None, end: int = None, **fields) -> None:
         if self._should_log(LogLevel.DEBUG):
-            timer = f" (In {str(end - start)[:5]}s)" if start and end else ""
-            log_message = f"{self.prefix}{Fore.GREEN}[{Fore.YELLOW}DEBUG{Fore.GREEN}] {Fore.BLACK}➔ {Fore.RESET} {message}{timer}"
-            print(log_message)
-            self._write_to_log(log_message)
+            self._log(LogLevel.DEBUG, "debug", "DEBUG", message, args, start, end, fields)
 
     def question(self, message: str, level: str = "QUESTION") -> None:
-        question_message = f"{self.prefix}{Fore.LIGHTCYAN_EX}{level} {Fore.BLACK}➔ {Fore.RESET} {message}"
-        print(question_message, end='')
-        i = input()
-        self._write_to_log(f"{question_message}")
+        self.flush()
+        flush_consoles()
+        record = LogRecord("question", level, message, level=LogLevel.INFO)
+        if self._console in self._sinks:
+            self._console.write(self._render(record, True), end='')
+            i = input()
+            self._emit_line(record)
+        else:
+            self._dispatch(record)
+            i = input()
         self._write_to_log(f"User Answer: {i}")
         return i
 
-log = Logger()
+# Key under which a BoundLogger passes itself to the level methods, removed again in _log(). Its fields travel
+# with it rather than as keyword arguments, so they can't collide with parameters like level or start.
+_CONTEXT = "_logmagix_context"
+
+class BoundLogger:
+    # Returned by Logger.bind() and Logger.child(): logs through the parent's sinks, filters and level with its
+    # own prefix and fields. Creating one only stores references; the prefix and the context segment are
+    # rendered for each palette on the first line and reused after that.
+    __slots__ = ("_parent", "_prefix_name", "_fields", "_context")
+
+    def __init__(self, parent: Logger, prefix: str | None, fields: dict):
+        self._parent = parent
+        self._prefix_name = prefix
+        self._fields = fields
+        self._context = None
+
+    def bind(self, **fields) -> "BoundLogger":
+        return BoundLogger(self._parent, self._prefix_name, {**self._fields, **fields})
+
+    def child(self, prefix: str | None) -> "BoundLogger":
+        return BoundLogger(self._parent, prefix, self._fields)
+
+    def _render_context(self) -> tuple:
+        # (prefix, rendered segment per palette, bound fields); the fields let a LogListener render it again
+        parent = self._parent
+        self._context = (self._prefix_name, {
+            color: parent._render_prefix(c, self._prefix_name) + parent._render_context(c, self._fields)
+            for color, c in parent._palettes.items()
+        }, self._fields)
+        return self._context
+
+    def __getattr__(self, name):
+        # Everything else (flush, set_level, timed, question, ...) is the parent's
+        return getattr(self._parent, name)
+
+def _bound_method(name: str) -> Callable:
+    def method(self, *args, **fields):
+        target = getattr(self._parent, name)
+        if target is _noop:
+            return None
+        return target(*args, **fields, **{_CONTEXT: self})
+    method.__name__ = name
+    return method
+
+for _name in ("success", "failure", "error", "warning", "critical", "info", "debug", "message", "message2",
+              "asuccess", "afailure", "aerror", "awarning", "ainfo", "adebug", "amessage", "amessage2"):
+    setattr(BoundLogger, _name, _bound_method(_name))
+# Skipped when the samplers look up the call site, so bound calls are keyed by their caller
+_BOUND_CODE = BoundLogger.info.__code__
+
+# Fields set with Logger.contextualize(), kept per logger as a BoundLogger. Each asyncio task runs in a
+# copy of the context, so they stay with the task that set them.
+_scoped = contextvars.ContextVar("logmagix_scoped", default=None)
+
+class Contextualize:
+    def __init__(self, logger: Logger, fields: dict):
+        self._logger = logger
+        self._fields = fields
+        self._token = None
+
+    def __enter__(self):
+        scoped = _scoped.get() or {}
+        current = scoped.get(self._logger)
+        view = current.bind(**self._fields) if current is not None else self._logger.bind(**self._fields)
+        self._token = _scoped.set({**scoped, self._logger: view})
+        return view
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _scoped.reset(self._token)
+
+def _async_method(name: str) -> Callable:
+    # Awaitable level methods: records go to the writer thread, which is started on first use if the logger
+    # wasn't created with async_mode=True. A full queue is waited on off the loop instead of blocking it.
+    async def method(self, *args, **fields):
+        target = getattr(self, name)
+        if target is _noop:
+            # Disabled level: nothing is queued and the writer isn't started
+            return
+        engine = self._engine or self._start_engine()
+        # A worker logger's QueueForwarder hands records to an unbounded multiprocessing queue instead
+        if isinstance(engine, AsyncEngine) and engine.overflow == "block" and engine.full():
+            import asyncio
+
+            await asyncio.get_running_loop().run_in_executor(None, engine.wait_for_room)
+        target(*args, **fields)
+    method.__name__ = f"a{name}"
+    return method
+
+for _name in ("success", "failure", "error", "warning", "info", "debug", "message", "message2"):
+    setattr(Logger, f"a{_name}", _async_method(_name))
+_ASYNC_CODE = Logger.ainfo.__code__
+
+_default_log = None
+
+def _get_default_log() -> Logger:
+    # Created on first use rather than at import time
+    global _default_log
+    if _default_log is None:
+        _default_log = Logger()
+    return _default_log
+
+def __getattr__(name):
+    if name == "log":
+        return _get_default_log()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Loader:
     def __init__(self, prefix: str = "discord.cyberious.xyz", desc="Loading...", end="\r", timeout=0.1):
@@ -259,9 +785,10 @@ class Loader:
         self.time = None  # Remove time initialization
         self.start_time = datetime.datetime.now()
 
-        self._thread = Thread(target=self._animate, daemon=True)
         self.steps = ["⢿", "⣻", "⣽", "⣾", "⣷", "⣯", "⣟", "⡿"]
         self.done = False
+        self._started = None
+        self._log = None
 
     def __enter__(self):
         self.start()
@@ -271,50 +798,166 @@ class Loader:
         self.stop()
 
     def start(self):
-        self._thread.start()
+        # Drawn by the shared renderer thread; `timeout` sets how often the spinner steps. The default logger
+        # is created here, not while the renderer draws, since creating it can log (e.g. the update notice).
+        self._log = _get_default_log()
+        flush_consoles()
+        self._started = time.monotonic()
+        renderer.add(self)
         return self
 
-    def _animate(self):
-        for c in cycle(self.steps):
-            if self.done:
-                break
-            current_time = datetime.datetime.now().strftime("%H:%M:%S")  # Get current time each iteration
-            loader_message = f"\r{log.PINK}[{log.MAGENTA}{self.prefix}{log.PINK}] [{log.BRIGHT_MAGENTA}{current_time}{log.PINK}] [{log.GREEN}{self.desc}{log.PINK}]{Fore.RESET} {c}"
-            print(loader_message, flush=True, end="")
-            time.sleep(self.timeout)
+    def render(self, now: float, current_time: str) -> str:
+        log = self._log
+        return f"{log.PINK}[{log.MAGENTA}{self.prefix}{log.PINK}] [{log.BRIGHT_MAGENTA}{current_time}{log.PINK}] [{log.GREEN}{self.desc}{log.PINK}]{Fore.RESET} {self._status()}"
+
+    def _status(self) -> str:
+        return self.steps[int((time.monotonic() - self._started) / self.timeout) % len(self.steps)]
 
     def stop(self):
+        if self.done:
+            return
         self.done = True
+        flush_consoles()
+        final = None
         if (self.end != "\r"):
             current_time = datetime.datetime.now().strftime("%H:%M:%S")  # Get current time for stop message
-            end_message = f"\n{log.PINK}[{log.MAGENTA}{self.prefix}{log.PINK}] [{log.BRIGHT_MAGENTA}{current_time}{log.PINK}] {log.GREEN} {self.end} {Fore.RESET}"
-            print(end_message, flush=True)
+            log = _get_default_log()
+            final = f"{log.PINK}[{log.MAGENTA}{self.prefix}{log.PINK}] [{log.BRIGHT_MAGENTA}{current_time}{log.PINK}] {log.GREEN} {self.end} {Fore.RESET}\n"
+        renderer.remove(self, final)
+
+class AsyncLoader(Loader):
+    # Stepped by a task on the running event loop instead of the renderer thread
+    def start(self):
+        import asyncio
+
+        self._log = _get_default_log()
+        flush_consoles()
+        self._started = time.monotonic()
+        renderer.add(self, threaded=False)
+        self._task = asyncio.get_running_loop().create_task(self._spin())
+        return self
+
+    async def _spin(self) -> None:
+        import asyncio
+
+        while not self.done:
+            await asyncio.sleep(renderer.frame_interval)
+            renderer.draw()
+
+    def stop(self):
+        super().stop()
+        self._task.cancel()
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+def _format_units(value: float, unit: str) -> str:
+    if unit != "B":
+        return f"{value:.0f}" if value >= 100 or value == int(value) else f"{value:.1f}"
+    for suffix in ("B", "KB", "MB", "GB", "TB"):
+        if abs(value) < 1024 or suffix == "TB":
+            return f"{value:.0f}{suffix}" if suffix == "B" else f"{value:.1f}{suffix}"
+        value /= 1024
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+class Progress(Loader):
+    # update() only adds to counters; rates, ETA and the bar are computed by the render thread once per frame
+    def __init__(self, total: int | None = None, prefix: str = "discord.cyberious.xyz", desc="Processing...", end="\r", timeout=0.1,
+                 unit: str = "it", width: int = 20, smoothing: float = 0.3):
+        super().__init__(prefix, desc, end, timeout)
+        self.total = total
+        self.unit = unit
+        self.width = width
+        self.smoothing = smoothing
+        self.n = 0
+        self.bytes = 0
+        self._last = None
+        self._rate = None
+        self._byte_rate = None
+
+    def update(self, n: int = 1, nbytes: int = 0) -> None:
+        self.n += n
+        if nbytes:
+            self.bytes += nbytes
+
+    def _smooth(self, average: float | None, value: float) -> float:
+        return value if average is None else self.smoothing * value + (1 - self.smoothing) * average
+
+    def _status(self) -> str:
+        log = self._log
+        now = time.monotonic()
+        n, nbytes = self.n, self.bytes
+        if self._last is None:
+            self._last = (self._started, 0, 0)
+        last_time, last_n, last_bytes = self._last
+        if now - last_time >= 0.25:
+            # Exponential moving average over ~quarter-second samples keeps the rate and ETA steady
+            self._rate = self._smooth(self._rate, (n - last_n) / (now - last_time))
+            self._byte_rate = self._smooth(self._byte_rate, (nbytes - last_bytes) / (now - last_time))
+            self._last = (now, n, nbytes)
+
+        parts = [self.steps[int((now - self._started) / self.timeout) % len(self.steps)]]
+        if self.total:
+            fraction = min(1.0, n / self.total)
+            filled = int(fraction * self.width)
+            parts.append(f"{log.GREEN}{'█' * filled}{log.PINK}{'░' * (self.width - filled)}{Fore.RESET} {fraction * 100:3.0f}%")
+            parts.append(f"{_format_units(n, self.unit)}/{_format_units(self.total, self.unit)}")
+        else:
+            parts.append(_format_units(n, self.unit))
+
+        stats = []
+        if self._rate is not None:
+            stats.append(f"{_format_units(self._rate, self.unit)} {self.unit}/s" if self.unit != "B" else f"{_format_units(self._rate, 'B')}/s")
+            if nbytes:
+                stats.append(f"{_format_units(self._byte_rate, 'B')}/s")
+            if self.total and self._rate > 0:
+                stats.append(f"ETA {_format_duration(max(0, self.total - n) / self._rate)}")
         else:
-            print(self.end, flush=True)
+            stats.append(f"{_format_duration(now - self._started)}")
+        parts.append(f"{log.PINK}[{log.BRIGHT_MAGENTA}{', '.join(stats)}{log.PINK}]{Fore.RESET}")
+        return " ".join(parts)
+
+_WHITE = "\033[38;2;255;255;255m"
+
+def _colorize(line: str, gradient: tuple) -> str:
+    # Same gradient as pystyle's Write.Print: the color advances on every visible character
+    out = []
+    n = 0
+    for char in line:
+        if char.strip():
+            out.append(f"\033[38;2;{gradient[n % len(gradient)]}m{char}")
+            n += 1
+        else:
+            out.append(char)
+    return "".join(out) + _WHITE
 
 class Home:
-    def __init__(self, text, align="left", adinfo1=None, adinfo2=None, credits=None, clear=True):
+    # Rendered banners keyed by everything that affects their content; oldest entries are evicted first
+    _cache = {}
+    CACHE_SIZE = 32
+
+    def __init__(self, text, align="left", adinfo1=None, adinfo2=None, credits=None, clear=True, gradient: list | None = None,
+                 font: str | Font | None = None):
         self.text = text
         self.align = align
         self.adinfo1 = adinfo1
         self.adinfo2 = adinfo2
         self.credits = credits
         self.clear = clear
+        self.gradient = gradient
+        self.font = font
         self.username = getpass.getuser()
 
     def _get_char_art(self):
-        char_arts = []
-        max_height = 8
-
-        for char in self.text:
-            char_art = ascii_art.get(char, [" " * 8] * 8)
-
-            if char.islower() and len(char_art) == 6:
-                char_art = [" " * 8] * 1 + char_art
-
-            char_arts.append(char_art)
-
-        return char_arts, max_height
+        font = load_font(self.font)
+        return [font.glyph(char) for char in self.text], font.height
 
     def _align_text(self, lines, terminal_width, alignment, block_width):
         aligned_result = []
@@ -334,7 +977,35 @@ class Home:
     def _clear(self):
         os.system('cls' if os.name == 'nt' else 'clear')
 
+    def render(self, terminal_width: int | None = None) -> str:
+        if terminal_width is None:
+            try:
+                terminal_width = os.get_terminal_size().columns
+            except OSError:
+                terminal_width = 80
+        if self.gradient is None:
+            from pystyle import Colors
+            gradient = tuple(Colors.red_to_blue)
+        else:
+            gradient = tuple(self.gradient)
+
+        key = (self.text, self.align, terminal_width, gradient, load_font(self.font).name, self.adinfo1, self.adinfo2, self.credits, self.username)
+        banner = Home._cache.get(key)
+        if banner is None:
+            banner = "".join(f"{_colorize(line, gradient)}\n" for line in self._banner_lines(terminal_width))
+            if len(Home._cache) >= self.CACHE_SIZE:
+                del Home._cache[next(iter(Home._cache))]
+            Home._cache[key] = banner
+        return banner
+
     def display(self):
+        banner = self.render()
+        if self.clear:
+            self._clear()
+        sys.stdout.write(banner)
+        sys.stdout.flush()
+
+    def _banner_lines(self, terminal_width):
         char_arts, max_height = self._get_char_art()
         result = [""] * max_height
 
@@ -343,33 +1014,17 @@ class Home:
             result[i] = line
 
         max_line_width = max(len(line) for line in result)
-
-        try:
-            terminal_width = os.get_terminal_size().columns
-        except OSError:
-            terminal_width = 80
-        
         aligned_result = self._align_text(result, terminal_width, self.align, max_line_width)
-        if self.clear:
-            self._clear()
-
-        for line in aligned_result:
-            Write.Print(line + "\n", Colors.red_to_blue, interval=0.000)
+        return aligned_result + self._adinfo_lines(aligned_result, terminal_width) + self._welcome_lines(terminal_width)
 
-        self._display_adinfo(aligned_result, terminal_width)
-        self._display_welcome(terminal_width, max_line_width)
-
-    def _display_adinfo(self, aligned_result, terminal_width):
+    def _adinfo_lines(self, aligned_result, terminal_width):
         if not (self.adinfo1 or self.adinfo2):
-            return
+            return []
 
         ascii_art_width = max(len(line.rstrip()) for line in aligned_result)
         adinfo_text = self._construct_adinfo_text(ascii_art_width)
         adinfo_block_width = len(adinfo_text)
-        aligned_adinfo = self._align_text([adinfo_text], terminal_width, self.align, adinfo_block_width)
-
-        for line in aligned_adinfo:
-            Write.Print(line + "\n", Colors.red_to_blue, interval=0.000)
+        return self._align_text([adinfo_text], terminal_width, self.align, adinfo_block_width)
 
     def _construct_adinfo_text(self, ascii_art_width):
         if self.adinfo1 and self.adinfo2:
@@ -382,7 +1037,7 @@ class Home:
                 return self.adinfo1 + '   ' + self.adinfo2
         return self.adinfo1 or self.adinfo2 or ''
 
-    def _display_welcome(self, terminal_width, block_width):
+    def _welcome_lines(self, terminal_width):
         welcome_message = f"Welcome {self.username}"
         if self.credits:
             welcome_message += f" | {self.credits}"
@@ -396,8 +1051,5 @@ class Home:
         welcome_line = " " * welcome_padding + welcome_message_with_tildes
         tilde_line_aligned = " " * tilde_padding + tilde_line
 
-        Write.Print(f"{welcome_line}\n", Colors.red_to_blue, interval=0.000)
-        Write.Print(f"{tilde_line_aligned}\n", Colors.red_to_blue, interval=0.000)
-
         equals_line = "═" * terminal_width
-        Write.Print(f"{equals_line}\n", Colors.red_to_blue, interval=0.000)
+        return [welcome_line, tilde_line_aligned, equals_line]
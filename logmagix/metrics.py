@@ -0,0 +1,69 @@
+import os
+import time
+
+from .sinks import _flusher
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}" if labels else ""
+
+def render_prometheus(stats: dict, prefix: str | None = None) -> str:
+    # Text exposition format, as read by node-exporter's textfile collector
+    base = {"prefix": prefix} if prefix else {}
+    lines = [
+        "# HELP logmagix_lines_total Log lines emitted, by level.",
+        "# TYPE logmagix_lines_total counter",
+    ]
+    for level, count in stats["lines"].items():
+        lines.append(f"logmagix_lines_total{_labels(**base, level=level)} {count}")
+    lines += [
+        "# HELP logmagix_sink_bytes_total Bytes written, by sink.",
+        "# TYPE logmagix_sink_bytes_total counter",
+    ]
+    for sink, count in stats["sinks"].items():
+        lines.append(f"logmagix_sink_bytes_total{_labels(**base, sink=sink)} {count}")
+    for name, kind, help_text in (
+        ("dropped", "counter", "Records dropped because the async queue was full."),
+        ("suppressed", "counter", "Records suppressed by deduplication or rate limits."),
+        ("sampled_out", "counter", "Records skipped by sampling."),
+        ("queue_depth", "gauge", "Records waiting in the async queue."),
+        ("queue_high_water", "gauge", "Highest async queue depth seen."),
+        ("format_seconds", "counter", "Time spent rendering lines."),
+        ("write_seconds", "counter", "Time spent writing lines to sinks."),
+    ):
+        metric = f"logmagix_{name}_total" if kind == "counter" else f"logmagix_{name}"
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}", f"{metric}{_labels(**base)} {stats[name]}"]
+    return "\n".join(lines) + "\n"
+
+class MetricsWriter:
+    # Rewrites a Prometheus textfile every `interval` seconds from the shared flusher thread
+    def __init__(self, logger, path: str, interval: float = 15.0):
+        self.logger = logger
+        self.path = path
+        self.interval = interval
+        self._last_write = 0.0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _flusher.register(self)
+
+    def write(self) -> None:
+        # Written to a temporary file and renamed so the collector never reads a partial file
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(render_prometheus(self.logger.stats(), self.logger._prefix_name))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Error writing metrics file: {e}")
+        self._last_write = time.monotonic()
+
+    def _tick(self) -> None:
+        if time.monotonic() - self._last_write >= self.interval:
+            self.write()
+
+    def close(self) -> None:
+        _flusher.unregister(self)
+        self.write()
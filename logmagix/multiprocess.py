@@ -0,0 +1,100 @@
+import os
+from threading import Thread
+
+from .engine import LogRecord
+from .logger import BoundLogger, Logger, LogLevel, SimpleLogger
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+_worker_log = None
+
+def _primitive(fields: dict) -> dict:
+    return {key: value if isinstance(value, _PRIMITIVES) else str(value) for key, value in fields.items()}
+
+def _pack(record: LogRecord, pid: int) -> tuple:
+    fields = _primitive(record.fields) if record.fields else None
+    # A bound view ships its prefix and fields, not the segment rendered with the worker's (prefix-less)
+    # palettes, so the listener renders it in its own style
+    context = (record.context[0], _primitive(record.context[2])) if record.context else None
+    return (record.kind, record.label, record.message, record.start, record.end, record.created,
+            record.level.value if record.level else None, fields, record.sample_rate, context, pid)
+
+def _unpack(data: tuple, logger: Logger) -> LogRecord:
+    kind, label, message, start, end, created, level, fields, sample_rate, context, pid = data
+    record = LogRecord(kind, label, message, start, end, LogLevel(level) if level else None, {"pid": pid, **(fields or {})})
+    record.created = created
+    record.sample_rate = sample_rate
+    if context:
+        # Worker loggers have no prefix of their own, so a view without a child() prefix takes the listener's
+        prefix, bound = context
+        record.context = BoundLogger(logger, logger._prefix_name if prefix is None else prefix, bound)._render_context()
+    return record
+
+class QueueForwarder:
+    # Stands in for a worker logger's AsyncEngine: records are shipped to the listener instead of written
+    def __init__(self, queue):
+        self._queue = queue
+        self._pid = os.getpid()
+
+    def put(self, record: LogRecord) -> None:
+        self._queue.put(_pack(record, self._pid))
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+class LogListener:
+    def __init__(self, logger: Logger, queue=None):
+        self.logger = logger
+        if queue is None:
+            import multiprocessing
+
+            queue = multiprocessing.Queue()
+        self.queue = queue
+        self._thread = None
+
+    @property
+    def initargs(self) -> tuple:
+        # Workers use the listener's style, so their records have the kinds and labels it renders
+        return (self.queue, self.logger.level, 2 if isinstance(self.logger, SimpleLogger) else 1)
+
+    def start(self) -> "LogListener":
+        self._thread = Thread(target=self._run, name="logmagix-listener", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        # A single reader keeps each worker's records in the order that worker sent them
+        while True:
+            data = self.queue.get()
+            if data is None:
+                return
+            try:
+                self.logger._dispatch(_unpack(data, self.logger))
+            except Exception as e:
+                print(f"Error handling worker log record: {e}")
+
+    def stop(self) -> None:
+        if self._thread and self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join()
+        self.logger.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+def worker_init(queue, level: LogLevel = LogLevel.DEBUG, style: int = 1) -> None:
+    global _worker_log
+
+    _worker_log = Logger(style=style, prefix=None, level=level, console=False, check_updates=False)
+    _worker_log._engine = QueueForwarder(queue)
+
+def worker_logger() -> Logger:
+    if _worker_log is None:
+        raise RuntimeError("worker_init() has not been called in this process")
+    return _worker_log
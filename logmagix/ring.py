@@ -0,0 +1,156 @@
+import mmap
+import os
+import struct
+import sys
+from threading import RLock
+
+from .sinks import _live_sinks
+
+# File layout: a fixed header, then `capacity` bytes of records written as a circular buffer. Each record is
+# UTF-8 text terminated by a NUL byte. `head` counts every byte ever written, so head % capacity is the next
+# write position; `tail` is the position (on the same scale) of the oldest record that is still intact.
+MAGIC = b"LMXRING\0"
+VERSION = 2
+HEADER = struct.Struct("<8sIIQQQ")
+HEADER_SIZE = 64
+HEAD_OFFSET = 24
+TAIL_OFFSET = 32
+_pack_offset = struct.Struct("<Q").pack_into
+
+class RingBufferSink:
+    color = False
+
+    def __init__(self, path: str, size: int = 4 * 1024 * 1024):
+        if size < 2:
+            raise ValueError(f"Ring buffer size must be at least 2 bytes, got {size}")
+        self.path = path
+        self._lock = RLock()
+        self.bytes_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # An existing ring is reopened as it is (with its own size) so the records of a crashed run are kept
+        header = _read_header(path)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if header:
+                self.capacity, self._head, self._tail = header
+            else:
+                self.capacity, self._head, self._tail = size, 0, 0
+                os.ftruncate(fd, 0)
+                _preallocate(fd, HEADER_SIZE + size)
+            self._mmap = mmap.mmap(fd, HEADER_SIZE + self.capacity)
+        finally:
+            os.close(fd)
+        if not header:
+            HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, 0, self.capacity, 0, 0)
+        _live_sinks.add(self)
+
+    def write(self, line: str) -> None:
+        if "\0" in line:
+            line = line.replace("\0", "\\0")
+        data = (line + "\0").encode("utf-8", "replace")
+        capacity = self.capacity
+        if len(data) > capacity:
+            data = data[:capacity - 1] + b"\0"
+        size = len(data)
+        with self._lock:
+            buffer = self._mmap
+            if buffer is None:
+                return
+            head = self._head
+            if head + size - self._tail > capacity:
+                # Move the tail past every record this write will overwrite (one past the first terminator at
+                # or after its last byte), and publish it before they are overwritten
+                offset = (head + size - 1) % capacity
+                found = buffer.find(b"\0", HEADER_SIZE + offset, HEADER_SIZE + capacity)
+                if found < 0:
+                    found = buffer.find(b"\0", HEADER_SIZE) + capacity
+                self._tail = head + size - capacity + found - HEADER_SIZE - offset
+                _pack_offset(buffer, TAIL_OFFSET, self._tail)
+            start = HEADER_SIZE + head % capacity
+            end = start + size
+            if end <= HEADER_SIZE + capacity:
+                buffer[start:end] = data
+            else:
+                split = HEADER_SIZE + capacity - start
+                buffer[start:] = data[:split]
+                buffer[HEADER_SIZE:HEADER_SIZE + size - split] = data[split:]
+            # Published after the record is in place: a crash mid-write leaves head on the previous record
+            self._head = head + size
+            _pack_offset(buffer, HEAD_OFFSET, self._head)
+            self.bytes_written += size
+
+    def flush(self) -> None:
+        # The mapping is shared with the page cache, so records survive a process crash without this;
+        # flush() also writes them to disk
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+                self._mmap.close()
+                self._mmap = None
+        _live_sinks.discard(self)
+
+def _preallocate(fd: int, size: int) -> None:
+    # Reserve the blocks up front where supported; a sparse file could fail to grow in the middle of a write
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+def _read_header(path: str) -> tuple | None:
+    try:
+        with open(path, "rb") as f:
+            raw = f.read(HEADER_SIZE)
+            f.seek(0, os.SEEK_END)
+            length = f.tell()
+    except OSError:
+        return None
+    if len(raw) < HEADER.size:
+        return None
+    magic, version, _, capacity, head, tail = HEADER.unpack_from(raw)
+    if magic != MAGIC or version != VERSION or length < HEADER_SIZE + capacity:
+        return None
+    return capacity, head, tail
+
+def read_ring(path: str) -> list[str]:
+    # Records from oldest to newest: everything between tail and head is intact, and a record that was being
+    # written when the process died is past head
+    with open(path, "rb") as f:
+        raw = f.read()
+    if len(raw) < HEADER.size:
+        raise ValueError(f"{path} is not a LogMagix ring buffer")
+    magic, version, _, capacity, head, tail = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a LogMagix ring buffer")
+    if version != VERSION:
+        raise ValueError(f"Unsupported ring buffer version {version}")
+
+    data = raw[HEADER_SIZE:HEADER_SIZE + capacity]
+    start, end = tail % capacity, head % capacity
+    if head - tail < capacity and start <= end:
+        ordered = data[start:end] if head != tail else b""
+    else:
+        ordered = data[start:] + data[:end]
+    return [record.decode("utf-8", "replace") for record in ordered.split(b"\0") if record]
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m logmagix.ring <path>")
+        sys.exit(2)
+    try:
+        for record in read_ring(sys.argv[1]):
+            print(record)
+    except (OSError, ValueError) as e:
+        print(f"Error reading ring buffer: {e}")
+        sys.exit(1)
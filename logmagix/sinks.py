@@ -0,0 +1,384 @@
+import atexit
+import datetime
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import signal
+import sys
+import time
+import weakref
+from threading import Event, Lock, RLock, Thread
+
+from .terminal import renderer
+
+_live_sinks = weakref.WeakSet()
+
+class _Flusher:
+    # One daemon thread shared by every sink that flushes on a time interval
+    def __init__(self, resolution: float = 0.05):
+        self.resolution = resolution
+        self._sinks = weakref.WeakSet()
+        self._lock = Lock()
+        self._wakeup = Event()
+        self._thread = None
+
+    def register(self, sink) -> None:
+        with self._lock:
+            self._sinks.add(sink)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="logmagix-flusher", daemon=True)
+                self._thread.start()
+
+    def unregister(self, sink) -> None:
+        with self._lock:
+            self._sinks.discard(sink)
+
+    def _run(self) -> None:
+        while not self._wakeup.wait(self.resolution):
+            with self._lock:
+                sinks = list(self._sinks)
+            for sink in sinks:
+                try:
+                    sink._tick()
+                except Exception as e:
+                    print(f"Error flushing log sink: {e}")
+
+_flusher = _Flusher()
+
+class _Housekeeper:
+    # Background thread for rotated segments, so compression and cleanup never block a write
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = Lock()
+        self._thread = None
+
+    def submit(self, fn, *args) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="logmagix-housekeeper", daemon=True)
+                self._thread.start()
+        self._queue.put((fn, args))
+
+    def _run(self) -> None:
+        while True:
+            fn, args = self._queue.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"Error in log housekeeping: {e}")
+            finally:
+                self._queue.task_done()
+
+    def wait(self) -> None:
+        self._queue.join()
+
+_housekeeper = _Housekeeper()
+
+_reopen_signals = set()
+
+def _on_reopen_signal(signum, frame) -> None:
+    # Only set a flag here; the reopen itself happens on the next write or tick
+    for sink in list(_live_sinks):
+        if isinstance(sink, FileSink) and sink.reopen_signal == signum:
+            sink._reopen_requested = True
+
+def _install_reopen_handler(signum: int) -> None:
+    # Only installed for sinks that ask for it: the handler replaces the signal's default action
+    if signum in _reopen_signals:
+        return
+    try:
+        previous = signal.getsignal(signum)
+
+        def handler(signum, frame):
+            _on_reopen_signal(signum, frame)
+            if callable(previous):
+                previous(signum, frame)
+
+        signal.signal(signum, handler)
+        _reopen_signals.add(signum)
+    except ValueError:
+        # signal.signal only works from the main thread
+        pass
+
+_coalescing_consoles = weakref.WeakSet()
+
+def _encoded_len(text: str) -> int:
+    # UTF-8 size for bytes_written; isascii() is a flag check, so ASCII lines skip the encode
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+def flush_consoles() -> None:
+    # Called before anything writes to the terminal outside a ConsoleSink (prompts, loaders)
+    for sink in list(_coalescing_consoles):
+        sink.flush()
+
+class ConsoleSink:
+    color = True
+
+    def __init__(self, stream=None, coalesce: bool = False, flush_interval: float = 0.05, flush_lines: int = 512):
+        self.stream = stream
+        self.coalesce = coalesce
+        self.flush_interval = flush_interval
+        self.flush_lines = flush_lines
+        self._buffer = []
+        self._lock = Lock()
+        self._last_flush = time.monotonic()
+        self.bytes_written = 0
+
+        if coalesce:
+            _coalescing_consoles.add(self)
+            _live_sinks.add(self)
+            _flusher.register(self)
+
+    def write(self, line: str, end: str = "\n") -> None:
+        self.bytes_written += _encoded_len(line) + len(end)
+        if not self.coalesce:
+            if renderer.active:
+                renderer.write(line + end, self.stream)
+                return
+            print(line, end=end, file=self.stream)
+            return
+        with self._lock:
+            self._buffer.append(line + end)
+            if len(self._buffer) >= self.flush_lines:
+                self._flush()
+
+    def _flush(self) -> None:
+        # One write (and one flush) for everything collected since the last tick
+        if self._buffer:
+            if renderer.active:
+                renderer.write("".join(self._buffer), self.stream)
+            else:
+                stream = self.stream or sys.stdout
+                stream.write("".join(self._buffer))
+                stream.flush()
+            self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        if self.coalesce:
+            with self._lock:
+                self._flush()
+
+    def _tick(self) -> None:
+        with self._lock:
+            if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def close(self) -> None:
+        self.flush()
+        _flusher.unregister(self)
+        _live_sinks.discard(self)
+        _coalescing_consoles.discard(self)
+
+class FileSink:
+    color = False
+
+    def __init__(self, path: str, buffer_size: int = 64 * 1024, flush_interval: float | None = 1.0, flush_lines: int | None = 1000,
+                 reopen_signal: int | None = None):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_lines = flush_lines
+        self.reopen_signal = reopen_signal
+        self._lock = RLock()
+        self._file = None
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._reopen_requested = False
+        self.bytes_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open()
+
+        _live_sinks.add(self)
+        if flush_interval:
+            _flusher.register(self)
+        if reopen_signal is not None:
+            _install_reopen_handler(reopen_signal)
+
+    def _open(self) -> None:
+        self._file = open(self.path, "a", encoding="utf-8", buffering=self.buffer_size)
+
+    def write(self, line: str) -> None:
+        self._write(line, _encoded_len(line) + 1)
+
+    def _write(self, line: str, size: int) -> None:
+        with self._lock:
+            if self._reopen_requested:
+                self._reopen()
+            if self._file is None:
+                self._open()
+            self._file.write(line + "\n")
+            self.bytes_written += size
+            self._pending += 1
+            if self.flush_lines and self._pending >= self.flush_lines:
+                self._flush()
+
+    def _flush(self) -> None:
+        if self._file is not None and self._pending:
+            self._file.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _tick(self) -> None:
+        with self._lock:
+            if self._reopen_requested:
+                self._reopen()
+            elif self._pending and time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def _reopen(self) -> None:
+        self._reopen_requested = False
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+        self._open()
+
+    def reopen(self) -> None:
+        with self._lock:
+            self._reopen()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+                self._file.close()
+                self._file = None
+        _flusher.unregister(self)
+        _live_sinks.discard(self)
+
+def default_encoder():
+    # orjson when it's installed, otherwise a compact stdlib json.dumps
+    try:
+        import orjson
+    except ImportError:
+        return lambda data: json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return lambda data: orjson.dumps(data, default=str).decode("utf-8")
+
+class JsonSink(FileSink):
+    # Structured sink: receives the record as a dict and writes one JSON object per line
+    color = None
+
+    def __init__(self, path: str, encoder=None, **kwargs):
+        self.encoder = encoder or default_encoder()
+        super().__init__(path, **kwargs)
+
+    def write(self, data: dict) -> None:
+        line = self.encoder(data)
+        super().write(line if isinstance(line, str) else line.decode("utf-8"))
+
+ROTATION_INTERVALS = {"hourly": 3600, "daily": 86400}
+
+class RotatingFileSink(FileSink):
+    def __init__(self, path: str, max_bytes: int | None = None, when: str | float | None = None, backup_count: int | None = None,
+                 max_age: float | None = None, compress: bool = True, **kwargs):
+        if isinstance(when, str) and when not in ROTATION_INTERVALS:
+            raise ValueError(f"Unknown rotation interval {when!r}, expected one of {', '.join(ROTATION_INTERVALS)} or a number of seconds")
+
+        self.max_bytes = max_bytes
+        self.when = when
+        self.backup_count = backup_count
+        self.max_age = max_age
+        self.compress = compress
+        self._size = 0
+        self._rollover_at = None
+        self._last_segment = (None, 0)
+        self._segment_pattern = re.compile(re.escape(os.path.basename(path)) + r"\.\d{8}-\d{6}(?:\.\d+)?(?:\.gz)?$")
+        super().__init__(path, **kwargs)
+
+        # Pick up segments a previous run rotated but never compressed or expired
+        _housekeeper.submit(self._housekeep, None)
+
+    def _open(self) -> None:
+        super()._open()
+        self._size = os.path.getsize(self.path)
+        if self.when:
+            self._rollover_at = self._next_rollover(time.time())
+
+    def _next_rollover(self, now: float) -> float:
+        if self.when == "daily":
+            moment = datetime.datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+            return (moment + datetime.timedelta(days=1)).timestamp()
+        if self.when == "hourly":
+            moment = datetime.datetime.fromtimestamp(now).replace(minute=0, second=0, microsecond=0)
+            return (moment + datetime.timedelta(hours=1)).timestamp()
+        return now + self.when
+
+    def write(self, line: str) -> None:
+        size = _encoded_len(line) + 1
+        with self._lock:
+            if (self.max_bytes and self._size and self._size + size > self.max_bytes) or (self._rollover_at and time.time() >= self._rollover_at):
+                self._rotate()
+            self._write(line, size)
+            self._size += size
+
+    def _segment_name(self) -> str:
+        # Several rotations within one second get increasing suffixes, never reusing an expired name
+        base = f"{self.path}.{time.strftime('%Y%m%d-%H%M%S')}"
+        n = self._last_segment[1] + 1 if self._last_segment[0] == base else 0
+        target = f"{base}.{n}" if n else base
+        while os.path.exists(target) or os.path.exists(target + ".gz"):
+            n += 1
+            target = f"{base}.{n}"
+        self._last_segment = (base, n)
+        return target
+
+    def _rotate(self) -> None:
+        # Runs under the sink lock: no other thread can write between the rename and the reopen
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+            self._file = None
+        target = self._segment_name()
+        os.replace(self.path, target)
+        self._open()
+        _housekeeper.submit(self._housekeep, target)
+
+    def rotate(self) -> None:
+        with self._lock:
+            self._rotate()
+
+    def _segments(self) -> list:
+        directory = os.path.dirname(self.path) or "."
+        return [os.path.join(directory, name) for name in os.listdir(directory) if self._segment_pattern.match(name)]
+
+    def _compress(self, segment: str) -> None:
+        tmp = segment + ".gz.tmp"
+        with open(segment, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        shutil.copystat(segment, tmp)
+        os.replace(tmp, segment + ".gz")
+        os.remove(segment)
+
+    def _housekeep(self, segment: str | None) -> None:
+        if self.compress:
+            for candidate in [segment] if segment else self._segments():
+                if not candidate.endswith(".gz") and os.path.exists(candidate):
+                    self._compress(candidate)
+
+        if not (self.backup_count is not None or self.max_age):
+            return
+        segments = sorted(self._segments(), key=os.path.getmtime, reverse=True)
+        expired = segments[self.backup_count:] if self.backup_count is not None else []
+        if self.max_age:
+            cutoff = time.time() - self.max_age
+            expired += [path for path in segments if path not in expired and os.path.getmtime(path) < cutoff]
+        for path in expired:
+            os.remove(path)
+
+@atexit.register
+def _close_live_sinks() -> None:
+    for sink in list(_live_sinks):
+        try:
+            sink.close()
+        except Exception:
+            pass
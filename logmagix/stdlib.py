@@ -0,0 +1,92 @@
+import logging
+
+from .engine import LogRecord
+from .logger import Logger, LogLevel, _get_default_log
+
+# Lowest stdlib level number for each LogLevel, checked from the top
+LEVEL_THRESHOLDS = (
+    (logging.CRITICAL, LogLevel.CRITICAL),
+    (logging.ERROR, LogLevel.FAILURE),
+    (logging.WARNING, LogLevel.WARNING),
+    (logging.INFO, LogLevel.INFO),
+)
+
+def map_level(levelno: int) -> LogLevel:
+    for threshold, level in LEVEL_THRESHOLDS:
+        if levelno >= threshold:
+            return level
+    return LogLevel.DEBUG
+
+class _Adapter:
+    # Shared by the handler and the formatter: levelno -> (LogLevel, kind, label) for the wrapped logger's style
+    def __init__(self, logger: Logger | None):
+        # Wrapping an existing logger (the default one if none is given) means no Logger.__init__ per handler
+        self.logger = logger or _get_default_log()
+        self._levels = {}
+
+    def _entry(self, levelno: int) -> tuple:
+        entry = self._levels.get(levelno)
+        if entry is None:
+            level = map_level(levelno)
+            kind, label = self.logger.LEVEL_KINDS[level]
+            entry = self._levels[levelno] = (level, kind, label)
+        return entry
+
+def _record_message(record: logging.LogRecord, formatter: logging.Formatter) -> str:
+    message = record.getMessage()
+    if record.exc_info and not record.exc_text:
+        record.exc_text = formatter.formatException(record.exc_info)
+    if record.exc_text:
+        message = f"{message}\n{record.exc_text}"
+    if record.stack_info:
+        message = f"{message}\n{formatter.formatStack(record.stack_info)}"
+    return message
+
+class MessageFormatter(logging.Formatter):
+    # LogMagixHandler's default: the message and traceback only, the LogMagix line format adds the rest.
+    # Set before logging.basicConfig() can attach its own default formatter.
+    def format(self, record: logging.LogRecord) -> str:
+        return _record_message(record, self)
+
+class LogMagixFormatter(logging.Formatter):
+    # For other handlers (e.g. StreamHandler, FileHandler) that should write lines in the LogMagix style
+    def __init__(self, logger: Logger | None = None, color: bool = True):
+        super().__init__()
+        self._adapter = _Adapter(logger)
+        self.color = color
+
+    def format(self, record: logging.LogRecord) -> str:
+        level, kind, label = self._adapter._entry(record.levelno)
+        line = LogRecord(kind, label, _record_message(record, self), level=level)
+        line.created = record.created
+        return self._adapter.logger._render(line, self.color)
+
+class LogMagixHandler(logging.Handler):
+    # Sends stdlib records through a LogMagix logger, so they reach its sinks, filters and async engine
+    def __init__(self, logger: Logger | None = None, level: int = logging.NOTSET):
+        super().__init__(level)
+        self._adapter = _Adapter(logger)
+        self.logger = self._adapter.logger
+        self.setFormatter(MessageFormatter())
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # The logger's level is checked before filters, the handler lock or getMessage(); the LogMagix
+        # sinks do their own locking, so the handler lock is not taken at all
+        level, kind, label = self._adapter._entry(record.levelno)
+        if level._value_ < self.logger._level._value_:
+            return False
+        result = self.filter(record)
+        if isinstance(result, logging.LogRecord):
+            record = result
+        if result:
+            self.emit(record, level, kind, label)
+        return bool(result)
+
+    def emit(self, record: logging.LogRecord, level: LogLevel | None = None, kind: str | None = None, label: str | None = None) -> None:
+        try:
+            if level is None:
+                level, kind, label = self._adapter._entry(record.levelno)
+            message = self.format(record)
+            self.logger._log(level, kind, label, message, fields={"logger": record.name})
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,42 @@
+import string
+
+LINE_FIELDS = ("prefix", "time", "label", "message", "timer")
+TIMER_FIELDS = ("elapsed",)
+
+_formatter = string.Formatter()
+
+class Template:
+    # A format string whose static fields (colors, fixed text) are baked in once.
+    # What is left is compiled into a lambda around a single f-string.
+    __slots__ = ("source", "fields", "render")
+
+    def __init__(self, source: str, static: dict | None = None, fields: tuple = LINE_FIELDS):
+        static = static or {}
+        text = []
+        for literal, field, spec, conversion in _formatter.parse(source):
+            text.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            # The spec and conversion end up inside an evaluated f-string, where a nested {...} would run as
+            # code; str.format only allows nested fields, which templates don't support, and !s/!r/!a
+            if spec and ("{" in spec or "}" in spec):
+                raise ValueError(f"Nested fields in format specs are not supported in log format {source!r}")
+            if conversion and conversion not in "sra":
+                raise ValueError(f"Unknown conversion !{conversion} in log format {source!r}")
+            if field in static:
+                value = static[field]
+                if conversion:
+                    value = _formatter.convert_field(value, conversion)
+                value = format(value, spec or "")
+                text.append(value.replace("{", "{{").replace("}", "}}"))
+            elif field in fields:
+                text.append("{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+            else:
+                raise ValueError(f"Unknown field {{{field}}} in log format {source!r}")
+
+        self.source = source
+        self.fields = fields
+        self.render = eval(f"lambda {', '.join(fields)}: f{''.join(text)!r}", {})
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
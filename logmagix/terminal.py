@@ -0,0 +1,109 @@
+import sys
+import time
+from threading import Event, Lock, Thread
+
+class TerminalRenderer:
+    # Owns the bottom of the terminal: every active loader is one line of a block that a single thread
+    # redraws at a fixed frame rate. Console output is written above the block through write().
+    # Loader lines are rendered outside the lock, so nothing a loader calls can re-enter the renderer.
+    def __init__(self, frame_interval: float = 0.05, stream=None):
+        self.frame_interval = frame_interval
+        self.stream = stream
+        self._loaders = []
+        self._version = 0
+        self._drawn = 0
+        self._lock = Lock()
+        self._stop = None
+        self._thread = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self._loaders)
+
+    def _stream(self):
+        return self.stream or sys.stdout
+
+    def _animated(self) -> bool:
+        # Pipes and files get no frames at all: only the lines written through write() and the final lines
+        stream = self._stream()
+        return hasattr(stream, "isatty") and stream.isatty()
+
+    def add(self, loader, threaded: bool = True) -> None:
+        # threaded=False leaves the redraws to the caller (AsyncLoader steps them from its event loop task)
+        with self._lock:
+            self._loaders.append(loader)
+            self._version += 1
+            if threaded and self._thread is None and self._animated():
+                # Each thread gets its own stop event, so a thread that is still winding down can't miss it
+                self._stop = Event()
+                self._thread = Thread(target=self._run, args=(self._stop,), name="logmagix-renderer", daemon=True)
+                self._thread.start()
+        self._redraw()
+
+    def remove(self, loader, final: str | None = None) -> None:
+        thread = None
+        with self._lock:
+            if loader in self._loaders:
+                self._loaders.remove(loader)
+                self._version += 1
+            if not self._loaders and self._thread is not None:
+                thread, self._thread = self._thread, None
+                self._stop.set()
+        self._redraw(final or "")
+        if thread is not None:
+            thread.join()
+
+    def write(self, text: str, stream=None) -> None:
+        # Log output while loaders are drawn: clear the block, write the text, draw the block again below it
+        target = stream or self._stream()
+        with self._lock:
+            if not self._drawn or target is not self._stream():
+                target.write(text)
+                return
+        if not text.endswith("\n"):
+            text = text.rstrip("\r") + "\n"
+        self._redraw(text)
+
+    def _redraw(self, text: str = "") -> None:
+        # Renders the block without the lock, then writes it under the lock unless the set of loaders
+        # changed in between, in which case the block is rendered again
+        while True:
+            loaders, version = list(self._loaders), self._version
+            frame = self._frame(loaders, time.time())
+            with self._lock:
+                if version != self._version:
+                    continue
+                if not text and not frame and not self._drawn:
+                    return
+                stream = self._stream()
+                stream.write(self._erase() + text + frame)
+                self._drawn = len(loaders) if frame else 0
+                stream.flush()
+                return
+
+    def _erase(self) -> str:
+        drawn, self._drawn = self._drawn, 0
+        if not drawn:
+            return ""
+        # Back to the first line of the block and clear to the end of the screen
+        return f"\x1b[{drawn}F\x1b[J"
+
+    def _frame(self, loaders: list, now: float) -> str:
+        if not loaders or not self._animated():
+            return ""
+        current_time = time.strftime("%H:%M:%S", time.localtime(now))
+        return "".join(f"{loader.render(now, current_time)}\n" for loader in loaders)
+
+    def draw(self) -> None:
+        if self._loaders:
+            self._redraw()
+
+    def _run(self, stop: Event) -> None:
+        while not stop.wait(self.frame_interval):
+            try:
+                self.draw()
+            except Exception as e:
+                print(f"Error drawing loaders: {e}")
+                return
+
+renderer = TerminalRenderer()
@@ -0,0 +1,92 @@
+import functools
+import time
+
+# Log-linear buckets: values below 2**(SUB_BITS + 1) ns are exact, larger ones keep SUB_BITS + 1 significant bits
+# (at most ~3% error). Durations above 2**MAX_BITS ns (~3 days) share the last bucket.
+SUB_BITS = 5
+MAX_BITS = 48
+_SUB = 1 << SUB_BITS
+BUCKETS = 2 * _SUB + (MAX_BITS - SUB_BITS - 1) * _SUB
+
+def _bucket(ns: int) -> int:
+    shift = ns.bit_length() - SUB_BITS - 1
+    if shift <= 0:
+        return ns
+    if shift > MAX_BITS - SUB_BITS - 1:
+        return BUCKETS - 1
+    return 2 * _SUB + (shift - 1) * _SUB + (ns >> shift) - _SUB
+
+def _bucket_upper(index: int) -> int:
+    if index < 2 * _SUB:
+        return index
+    shift, offset = divmod(index - 2 * _SUB, _SUB)
+    shift += 1
+    return ((offset + _SUB + 1) << shift) - 1
+
+class LatencyHistogram:
+    # Fixed memory per name whatever the number of samples; updates are unlocked like the other counters
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        self.counts[_bucket(ns)] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, q: float) -> int:
+        if not self.count:
+            return 0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(_bucket_upper(index), self.max)
+        return self.max
+
+class Timed:
+    # Returned by Logger.timed(): a context manager, or a decorator timing every call of a function
+    def __init__(self, logger, name: str, level, log: bool = True):
+        self._logger = logger
+        self.name = name
+        self.level = level
+        self.log = log
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._logger._record_timing(self.name, self._start, time.perf_counter_ns(), self.level, self.log)
+
+    def __call__(self, func):
+        import inspect
+
+        logger, name, level, log = self._logger, self.name, self.level, self.log
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def timed_coroutine(*args, **kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    logger._record_timing(name, start, time.perf_counter_ns(), level, log)
+            return timed_coroutine
+
+        @functools.wraps(func)
+        def timed_function(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                logger._record_timing(name, start, time.perf_counter_ns(), level, log)
+        return timed_function
@@ -1,10 +1,16 @@
-import requests
+import json
+import os
 import threading
+import time
 
 from packaging import version
 from .logger import Logger
 from .version import __version__
 
+DISABLE_ENV = "LOGMAGIX_NO_UPDATE_CHECK"
+INDEX_URL_ENV = "LOGMAGIX_UPDATE_INDEX_URL"
+DEFAULT_INDEX_URL = "https://pypi.org/pypi/{package}/json"
+
 class UpdateStatus:
     IDLE = "idle"
     CHECKING = "checking"
@@ -14,6 +20,13 @@ class UpdateStatus:
     FAILED = "failed"
     UP_TO_DATE = "up_to_date"
 
+def updates_disabled() -> bool:
+    return os.environ.get(DISABLE_ENV, "").strip().lower() not in ("", "0", "false", "no")
+
+def default_cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "logmagix", "update-check.json")
+
 class AutoUpdater:
     _instance = None
     _initialized = False
@@ -24,12 +37,17 @@ class AutoUpdater:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, package_name: str, logger: Logger = None):
+    def __init__(self, package_name: str, logger: Logger = None, index_url: str | None = None, timeout: float = 2.0,
+                 cache_ttl: float = 86400, cache_path: str | None = None):
         if not AutoUpdater._initialized:
-            self.package_name = package_name.split("x")
-            self.logger = logger or Logger()
+            self.package_name = package_name
+            self.logger = logger or Logger(check_updates=False)
             self.current_version = __version__
             self.pypi_version = None
+            self.index_url = (index_url or os.environ.get(INDEX_URL_ENV) or DEFAULT_INDEX_URL).format(package=package_name)
+            self.timeout = timeout
+            self.cache_ttl = cache_ttl
+            self.cache_path = cache_path or default_cache_path()
             self._checked_version = version.parse(self.current_version)
             self._latest_version = None
             self._update_checked = False
@@ -39,24 +57,90 @@ class AutoUpdater:
             self._lock = threading.Lock()
             AutoUpdater._initialized = True
 
-    def get_pypi_version(self) -> str: 
+    @property
+    def status(self) -> str:
+        return self._status
+
+    def get_pypi_version(self) -> str:
+        from urllib.request import urlopen
+
         try:
-            response = requests.get(f"https://pypi.org/pypi/{self.package_name[0]}/json")
-            if response.status_code == 200:
-                return response.json()["info"]["version"]
+            with urlopen(self.index_url, timeout=self.timeout) as response:
+                return json.load(response)["info"]["version"]
         except Exception as e:
-            self.logger.warning(f"Failed to fetch PyPI version: {e}")
+            self._status_message = f"Failed to fetch PyPI version: {e}"
         return "0.0.0"
-        
+
     def update_available(self) -> bool:
         if not self._latest_version:
             return False
         return self._latest_version > self._checked_version
-    
+
+    def _read_cache(self) -> dict | None:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+            # A claim written before fetching only holds for the fetch timeout, in case its process died first
+            ttl = min(cache.get("ttl", self.cache_ttl), self.cache_ttl)
+            if cache.get("index_url") == self.index_url and time.time() - cache["checked_at"] < ttl:
+                return cache
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_cache(self, latest: str | None, pending: bool = False) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                entry = {"checked_at": time.time(), "index_url": self.index_url, "latest": latest}
+                if pending:
+                    entry.update(pending=True, ttl=self.timeout)
+                json.dump(entry, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    def _set_latest(self, latest: str | None) -> None:
+        with self._lock:
+            self.pypi_version = latest
+            self._latest_version = version.parse(latest) if latest and latest != "0.0.0" else None
+            if self.update_available():
+                self._status = UpdateStatus.UPDATE_AVAILABLE
+                self._status_message = f"logmagix {latest} is available (installed: {self.current_version}), run: pip install -U logmagix"
+            elif self._latest_version:
+                self._status = UpdateStatus.UP_TO_DATE
+            else:
+                self._status = UpdateStatus.FAILED
+        if self._status == UpdateStatus.UPDATE_AVAILABLE:
+            self.logger.info(self._status_message)
+
+    def _fetch(self) -> None:
+        latest = self.get_pypi_version()
+        latest = latest if latest != "0.0.0" else None
+        # A failed check is cached too, so an unreachable index costs one timeout per TTL, not one per process
+        self._write_cache(latest)
+        self._set_latest(latest)
+
     def check_for_updates(self) -> None:
-        if self._update_checked:
+        if self._update_checked or updates_disabled():
             return
-        if self.update_available():
-            self.update()
-    
         self._update_checked = True
+
+        cache = self._read_cache()
+        if cache is not None:
+            # Another process is fetching right now: nothing to report in this one
+            if not cache.get("pending"):
+                self._set_latest(cache.get("latest"))
+            return
+
+        # Claim the check before fetching so processes started meanwhile don't fetch too. The claim expires
+        # after the fetch timeout: a short-lived process can exit before its daemon thread finishes.
+        self._write_cache(None, pending=True)
+        self._status = UpdateStatus.CHECKING
+        self._update_thread = threading.Thread(target=self._fetch, name="logmagix-update-check", daemon=True)
+        self._update_thread.start()
+
+    def wait(self, timeout: float | None = None) -> None:
+        if self._update_thread:
+            self._update_thread.join(timeout)
@@ -0,0 +1,54 @@
+"""Worker loggers forwarding to a LogListener.
+
+    python -m pytest tests
+"""
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from logmagix import Logger, LogListener, worker_init, worker_logger
+
+def fail(message: str) -> None:
+    worker_logger().critical(message, exit_code=3)
+
+def read_json(path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_worker_critical_reaches_listener(tmp_path, capfd):
+    path = tmp_path / "log.jsonl"
+    log = Logger(console=False, json_file=str(path), check_updates=False)
+    with LogListener(log) as listener:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(1, mp_context=context, initializer=worker_init, initargs=listener.initargs) as pool:
+            error = pool.submit(fail, "disk full").exception(10)
+    log.close()
+
+    # The worker exits without waiting on input() or printing to its own stdout
+    assert isinstance(error, SystemExit) and error.code == 3
+    assert "disk full" not in capfd.readouterr().out
+    records = read_json(path)
+    assert [(record["level"], record["message"]) for record in records] == [("CRITICAL", "disk full")]
+    assert records[0]["pid"] != multiprocessing.current_process().pid
+
+def bound(n: int) -> None:
+    log = worker_logger()
+    log.bind(job=n).info("bound")
+    log.child("db").info("child")
+
+def test_worker_bound_lines_use_listener_prefix(tmp_path):
+    path = tmp_path / "log.jsonl"
+    text = tmp_path / "log.txt"
+    log = Logger(prefix="app", console=False, json_file=str(path), log_file=str(text), check_updates=False)
+    with LogListener(log) as listener:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(1, mp_context=context, initializer=worker_init, initargs=listener.initargs) as pool:
+            pool.submit(bound, 7).result(10)
+    log.close()
+
+    records = read_json(path)
+    assert [(record["message"], record["prefix"]) for record in records] == [("bound", "app"), ("child", "db")]
+    assert records[0]["job"] == 7
+    lines = [line for line in text.read_text(encoding="utf-8").splitlines() if line.startswith("[")]
+    assert lines[0].startswith("[app] ") and "[job=7] " in lines[0]
+    assert lines[1].startswith("[db] ")
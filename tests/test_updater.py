@@ -0,0 +1,110 @@
+"""AutoUpdater against a local index served with http.server.
+
+    python -m pytest tests
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from logmagix import Logger
+from logmagix.updater import AutoUpdater, UpdateStatus
+
+class Index:
+    def __init__(self, version: str = "99.0.0", delay: float = 0.0):
+        self.version = version
+        self.delay = delay
+        self.requests = 0
+        index = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                index.requests += 1
+                time.sleep(index.delay)
+                body = json.dumps({"info": {"version": index.version}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/pypi/{{package}}/json"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def index():
+    index = Index()
+    yield index
+    index.close()
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("LOGMAGIX_NO_UPDATE_CHECK", raising=False)
+    return str(tmp_path / "update-check.json")
+
+def updater(index: Index, cache_path: str, timeout: float = 2.0) -> AutoUpdater:
+    # AutoUpdater is a process-wide singleton; start from a fresh one for every check
+    AutoUpdater._instance = None
+    AutoUpdater._initialized = False
+    logger = Logger(console=False, check_updates=False)
+    return AutoUpdater("logmagix", logger, index_url=index.url, timeout=timeout, cache_path=cache_path)
+
+def test_check_reports_update_and_caches(index, cache_path):
+    first = updater(index, cache_path)
+    first.check_for_updates()
+    first.wait(5)
+    assert first.status == UpdateStatus.UPDATE_AVAILABLE
+    assert first.pypi_version == "99.0.0"
+
+    second = updater(index, cache_path)
+    second.check_for_updates()
+    assert second.status == UpdateStatus.UPDATE_AVAILABLE
+    assert index.requests == 1
+
+def test_slow_index_does_not_block(index, cache_path):
+    index.delay = 1.0
+    check = updater(index, cache_path, timeout=0.2)
+    started = time.monotonic()
+    check.check_for_updates()
+    assert time.monotonic() - started < 0.1
+    assert check.status == UpdateStatus.CHECKING
+    check.wait(5)
+    assert check.status == UpdateStatus.FAILED
+
+def test_claim_of_exited_process_expires(index, cache_path):
+    # A process that exits before its fetch finishes leaves only the claim behind
+    claim = updater(index, cache_path, timeout=0.2)
+    claim._write_cache(None, pending=True)
+
+    blocked = updater(index, cache_path, timeout=0.2)
+    blocked.check_for_updates()
+    assert blocked.status == UpdateStatus.IDLE
+    assert index.requests == 0
+
+    time.sleep(0.3)
+    retry = updater(index, cache_path, timeout=0.2)
+    retry.check_for_updates()
+    retry.wait(5)
+    assert retry.status == UpdateStatus.UPDATE_AVAILABLE
+    assert index.requests == 1
+    with open(cache_path, encoding="utf-8") as f:
+        assert "pending" not in json.load(f)
+
+def test_disabled_by_environment(index, cache_path, monkeypatch):
+    monkeypatch.setenv("LOGMAGIX_NO_UPDATE_CHECK", "1")
+    check = updater(index, cache_path)
+    check.check_for_updates()
+    assert check.status == UpdateStatus.IDLE
+    assert index.requests == 0
+    assert not os.path.exists(cache_path)